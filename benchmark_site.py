@@ -0,0 +1,200 @@
+"""Benchmark the site generator on synthetic corpora of increasing size.
+
+Builds archive trees of N projects x M images and toolbox trees of K GHX files in a
+temporary directory, then times generate_archive_html, generate_toolbox_html and the
+full main() build (without starting the server) for each project count.
+"""
+import re
+import sys
+import json
+import math
+import time
+import uuid
+import random
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import generate_site
+
+# Tags drawn from the real projects so the filter bar has a realistic spread
+TAG_POOL = sorted({tag for data in generate_site.projects.values() for tag in data['tags']})
+
+def write_image(path: Path, size: tuple, seed: int):
+    """Write a unique JPEG so every image misses the derivative cache."""
+    from PIL import Image, ImageDraw
+    rng = random.Random(seed)
+    img = Image.new('RGB', size, tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(24):
+        x0, y0 = rng.randrange(size[0]), rng.randrange(size[1])
+        x1, y1 = x0 + rng.randrange(size[0] // 2 + 1), y0 + rng.randrange(size[1] // 2 + 1)
+        draw.rectangle([x0, y0, x1, y1], fill=tuple(rng.randrange(256) for _ in range(3)))
+    img.save(path, 'JPEG', quality=90)
+
+def synthesize_archive(root: Path, project_count: int, image_count: int, image_size: tuple) -> Dict[str, Dict]:
+    """Create archive/<project>/ folders and return matching entries for the projects dict."""
+    rng = random.Random(project_count)
+    synthetic_projects = {}
+    for i in range(project_count):
+        name = f"project_{i:04d}"
+        project_dir = root / 'archive' / name
+        project_dir.mkdir(parents=True)
+        for j in range(image_count):
+            write_image(project_dir / f"image_{j:02d}.jpg", image_size, seed=i * 1000 + j)
+        with open(project_dir / 'readme.txt', 'w') as f:
+            f.write(f"synthetic project {i}\n")
+        synthetic_projects[name] = {
+            'tags': rng.sample(TAG_POOL, min(4, len(TAG_POOL))),
+            'description': f"synthetic benchmark project {i} with {image_count} images."
+        }
+    return synthetic_projects
+
+def load_ghx_template(template: Path) -> tuple:
+    """Split a real GHX file into the text before, the object chunks of and the text after DefinitionObjects."""
+    lines = template.read_text(encoding='utf-8-sig').splitlines(keepends=True)
+    starts = [i for i, line in enumerate(lines) if re.match(r'\s*<chunk name="Object" index="\d+">', line)]
+    indent = lines[starts[0]][:len(lines[starts[0]]) - len(lines[starts[0]].lstrip())]
+    objects = []
+    for start in starts:
+        if not lines[start].startswith(indent + '<'):
+            continue  # Nested object, e.g. inside a cluster
+        end = next(i for i in range(start, len(lines)) if lines[i] == f"{indent}</chunk>\n")
+        objects.append(''.join(lines[start:end + 1]))
+        last_end = end
+    first_start = next(start for start in starts if lines[start].startswith(indent + '<'))
+    return ''.join(lines[:first_start]), objects, ''.join(lines[last_end + 1:])
+
+def synthesize_ghx(path: Path, template: tuple, target_bytes: int):
+    """Write a GHX of roughly target_bytes by repeating the template's objects with fresh GUIDs."""
+    head, objects, tail = template
+    chunks = []
+    size = len(head) + len(tail)
+    index = 0
+    while size < target_bytes or not chunks:
+        obj = objects[index % len(objects)]
+        obj = re.sub(r'index="\d+">', f'index="{index}">', obj, count=1)
+        obj = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', lambda _: str(uuid.uuid4()), obj)
+        chunks.append(obj)
+        size += len(obj)
+        index += 1
+    head = re.sub(r'(<item name="ObjectCount"[^>]*>)\d+', rf'\g<1>{index}', head)
+    head = re.sub(r'<chunks count="\d+">(\s*)$', f'<chunks count="{index}">\\1', head)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\ufeff' + head + ''.join(chunks) + tail)
+
+def synthesize_toolbox(root: Path, tool_count: int, ghx_bytes: int, template_path: Path):
+    """Create toolbox/<tool>.ghx files and readmes in the layout of the real toolbox."""
+    toolbox_dir = root / 'toolbox'
+    toolbox_dir.mkdir(parents=True, exist_ok=True)
+    template = load_ghx_template(template_path)
+    for i in range(tool_count):
+        name = f"tool_{i:04d}"
+        synthesize_ghx(toolbox_dir / f"{name}.ghx", template, ghx_bytes)
+        with open(toolbox_dir / f"{name}_readme.txt", 'w') as f:
+            f.write(f"synthetic grasshopper definition {i}\n")
+
+def timed(function) -> float:
+    """Run a function and return its wall time in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def run_benchmark(root: Path, project_count: int, args: argparse.Namespace) -> Dict:
+    """Synthesize a corpus of project_count projects and time each build path on it."""
+    synthetic_projects = synthesize_archive(root, project_count, args.images, args.image_size)
+    synthesize_toolbox(root, args.tools, args.ghx_kb * 1024, args.template)
+    generate_site.set_site_root(root)
+    generate_site.projects.clear()
+    generate_site.projects.update(synthetic_projects)
+
+    timings = {}
+    # The first archive build encodes every derivative; later builds hit the image cache
+    timings['generate_archive_html'] = timed(generate_site.generate_archive_html)
+    generate_site.reset_inventory()
+    timings['generate_archive_html (warm)'] = timed(generate_site.generate_archive_html)
+    generate_site.reset_inventory()
+    timings['generate_toolbox_html'] = timed(generate_site.generate_toolbox_html)
+    timings['main --force'] = timed(lambda: generate_site.main(['--force', '--no-serve']))
+    with open(generate_site.BUILD_REPORT_PATH, 'r') as f:
+        stages = {('  ' * stage['depth']) + stage['name']: stage['wall_seconds'] for stage in json.load(f)['stages']}
+    timings['main (no-op)'] = timed(lambda: generate_site.main(['--no-serve']))
+    return {'projects': project_count, 'timings': timings, 'stages': stages}
+
+def scaling_exponent(small: Dict, large: Dict, key: str, group: str) -> Optional[float]:
+    """Slope of log(time) against log(projects) between two runs; above 1 means superlinear."""
+    t0, t1 = small[group].get(key), large[group].get(key)
+    if not t0 or not t1 or t0 <= 0 or t1 <= 0:
+        return None
+    return math.log(t1 / t0) / math.log(large['projects'] / small['projects'])
+
+def format_results(results: List[Dict]) -> str:
+    """Format timings per project count, with the scaling exponent against the previous count."""
+    lines = []
+    for group in ('timings', 'stages'):
+        keys = list(dict.fromkeys(key for result in results for key in result[group]))
+        header = ['projects'] + keys
+        rows = [header]
+        for i, result in enumerate(results):
+            row = [str(result['projects'])]
+            for key in keys:
+                cell = f"{result[group].get(key, 0) * 1000:.1f} ms"
+                if i:
+                    exponent = scaling_exponent(results[i - 1], result, key, group)
+                    if exponent is not None:
+                        cell += f" (x^{exponent:.2f}{'!' if exponent > 1.2 else ''})"
+                row.append(cell)
+            rows.append(row)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines.append('Full build stages:' if group == 'stages' else 'Build paths:')
+        lines.extend('  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+        lines.append('')
+    lines.append("x^k is the scaling exponent against the previous project count; '!' marks superlinear growth.")
+    return '\n'.join(lines)
+
+def parse_size(value: str) -> tuple:
+    width, _, height = value.partition('x')
+    return int(width), int(height)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the site generator on synthetic corpora.")
+    parser.add_argument('--projects', default='1,10,100,1000',
+                        help="comma-separated project counts to benchmark (default: 1,10,100,1000)")
+    parser.add_argument('--images', type=int, default=3, help="images per project (default: 3)")
+    parser.add_argument('--image-size', type=parse_size, default=(800, 600), metavar='WxH',
+                        help="size of the synthetic images (default: 800x600)")
+    parser.add_argument('--tools', type=int, default=10, help="GHX files in the toolbox (default: 10)")
+    parser.add_argument('--ghx-kb', type=int, default=512, help="approximate size of each GHX file (default: 512)")
+    parser.add_argument('--template', type=Path,
+                        default=generate_site.TOOLBOX_DIR / 'lego_bridge_aggregation.ghx',
+                        help="real GHX file whose structure the synthetic files repeat")
+    parser.add_argument('--output', type=Path, help="also write the results as JSON to this file")
+    parser.add_argument('--keep', action='store_true', help="keep the synthetic corpora instead of deleting them")
+    args = parser.parse_args(argv)
+    args.projects = [int(count) for count in args.projects.split(',')]
+    return args
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    # The generator logs every page and image; keep only the benchmark output
+    generate_site.logger.setLevel(logging.WARNING)
+    results = []
+    for project_count in args.projects:
+        root = Path(tempfile.mkdtemp(prefix=f"site_bench_{project_count}_"))
+        try:
+            print(f"Benchmarking {project_count} projects in {root}", file=sys.stderr)
+            results.append(run_benchmark(root, project_count, args))
+        finally:
+            if not args.keep:
+                shutil.rmtree(root, ignore_errors=True)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'settings': {key: str(value) for key, value in vars(args).items()}, 'results': results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 
 import os
-import shutil
+import sys
+import json
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict
-import xml.etree.ElementTree as ET
-from pdf2image import convert_from_path
+from typing import Optional, List, Dict, Callable, Iterable, Iterator, NamedTuple, TYPE_CHECKING
 import logging
-import random
-import signal
+import time
+import functools
+from contextlib import contextmanager
+
+# Heavier modules (argparse, hashlib, datetime, threading, re, xml.etree, concurrent.futures, Pillow, pdf2image, pypdf, ...)
+# are imported by the functions that use them, so importing this module stays cheap and touches no other files.
+if TYPE_CHECKING:
+    import argparse
+    import xml.etree.ElementTree as ET
+    from PIL import Image
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,6 +26,99 @@ SITE_ROOT = Path(__file__).parent
 ARCHIVE_DIR = SITE_ROOT / 'archive'
 TOOLBOX_DIR = SITE_ROOT / 'toolbox'
 OUTPUT_DIR = SITE_ROOT
+GENERATOR_PATH = Path(__file__)
+
+# Build state (ignored by git and by the static host)
+BUILD_DIR = SITE_ROOT / '.build'
+BUILD_MANIFEST_PATH = BUILD_DIR / 'manifest.json'
+MANIFEST_VERSION = 1
+BUILD_REPORT_PATH = BUILD_DIR / 'report.json'
+
+# Image files picked up from project folders (matched case-sensitively)
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.gif', '.png', '.JPG', '.JPEG', '.GIF', '.PNG']
+
+# Resolution used when rasterizing presentation PDFs into previews
+PDF_PREVIEW_DPI = 150
+
+# Dev mode: pages include a client that reloads them (or swaps changed images and CSS) after rebuilds
+LIVE_RELOAD = False
+LIVE_RELOAD_PATH = '/__livereload'
+
+# Responsive image derivatives
+DERIVATIVES_DIR = SITE_ROOT / 'derivatives'
+# Prebuilt HTML that pages fetch on demand, such as each project's images in the archive
+FRAGMENTS_DIR = SITE_ROOT / 'fragments'
+THUMBNAIL_WIDTHS = [160, 320, 480]
+IMAGE_WIDTHS = [480, 960, 1600]
+THUMBNAIL_SIZES = '120px'
+IMAGE_SIZES = '(max-width: 768px) calc(100vw - 4rem), (max-width: 1200px) 50vw, 370px'
+# Per-format encoder quality; modern formats are only emitted when the installed Pillow can encode them
+IMAGE_QUALITY = {'avif': 50, 'webp': 75, 'jpeg': 82}
+MODERN_IMAGE_FORMATS = ['avif', 'webp']
+IMAGE_FORMAT_EXTENSIONS = {'avif': '.avif', 'webp': '.webp', 'jpeg': '.jpg', 'png': '.png'}
+IMAGE_MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+IMAGE_CACHE_DIR = BUILD_DIR / 'image_cache'
+IMAGE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# Image URLs carry ?v=<content hash prefix>, so a changed file always gets a new URL and can be cached for good
+ASSET_VERSION_LENGTH = 12
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Linux ioctl that makes a file share another's blocks on copy-on-write filesystems (Btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+# Buffer size for streamed copies when the kernel cannot copy a file by itself
+COPY_CHUNK_SIZE = 1 << 20
+
+# GHX chunks holding a component's input and output parameters, for the component graph index
+GHX_PARAM_CHUNKS = {'param_input': 'inputs', 'InputParam': 'inputs', 'param_output': 'outputs', 'OutputParam': 'outputs'}
+# Bump when the index format changes, so every GHX is reindexed
+GHX_INDEX_VERSION = 1
+# The code viewer fetches GHX files in line-aligned pages of about this many bytes
+GHX_PAGE_BYTES = 64 * 1024
+# What the code viewer shows: the GHX as is, re-indented without redundant markup, or without any indentation
+GHX_PREVIEW_MODES = ('original', 'canonical', 'minified')
+GHX_PREVIEW_MODE = 'original'
+GHX_CANONICAL_INDENT = b'  '
+# Opening and closing tags on a line, for tracking nesting depth; comments and declarations are skipped
+XML_DEPTH_PATTERN = rb'<(/?)[^\s/>?!][^>]*?(/?)>'
+# type_code is a numeric alias of type_name, repeated on every item
+GHX_TYPE_CODE_PATTERN = rb'(<item [^>]*?) type_code="\d+"'
+# Highlighted pages are cached by content; bump the version when the highlighter's output changes
+GHX_HIGHLIGHT_VERSION = 1
+GHX_HIGHLIGHT_CACHE_DIR = BUILD_DIR / 'ghx_highlight'
+GHX_HIGHLIGHT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Tokens inside an XML tag: whitespace, attribute names, '=', an opening quote, the tag's end, anything else
+XML_TAG_TOKEN_PATTERN = r'(?s)(\s+)|([^\s=/>?"\']+)|(=)|(["\'])|(/?>|\?>)|(.)'
+XML_TAG_OPEN_PATTERN = r'<[/?!]?[^\s/>?]*'
+
+# Text outputs that get precompressed .br/.gz siblings for static hosting and the dev server
+COMPRESSIBLE_EXTENSIONS = ['.html', '.css', '.js', '.svg', '.ghx', '.json']
+COMPRESSION_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+COMPRESSION_LEVELS = {'br': 11, 'gzip': 9}
+# Watch-mode rebuilds trade some size for speed; Brotli 11 takes about half a second on archive.html
+FAST_COMPRESSION_LEVELS = {'br': 5, 'gzip': 6}
+# Bytes of on-the-fly compressed responses the dev server keeps in memory
+COMPRESSED_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+# Larger files without a precompressed sibling are sent as is, with sendfile, instead of compressed in memory
+COMPRESSED_RESPONSE_MAX_FILE_BYTES = 1024 * 1024
+# Watch mode polls the build inputs this often and waits this long for a burst of changes to settle
+WATCH_INTERVAL = 0.2
+WATCH_DEBOUNCE = 0.1
+# Static assets next to the pages that are watched too, so stylesheet edits can be swapped in live
+WATCH_ASSET_EXTENSIONS = ('.css', '.js')
+# Files the build writes next to its inputs, which must not trigger another rebuild; in previews/
+# folders, the pages rasterized from a PDF (<pdf stem>_<page>.png) are too, unlike hand-placed images
+WATCH_IGNORED_SUFFIXES = ('.gz', '.br', '.tmp', '.html', '.pages.json')
+# Dev server Cache-Control by content type prefix; the first match wins
+CACHE_CONTROL_POLICIES = [
+    # Pages, styles, scripts and GHX change on every rebuild, so always revalidate (cheap with ETags)
+    ('text/', 'no-cache'),
+    ('application/javascript', 'no-cache'),
+    ('application/xml', 'no-cache'),
+    ('image/svg+xml', 'no-cache'),
+    # Images, previews and downloads rarely change between rebuilds; reuse them briefly without asking
+    ('image/', 'public, max-age=300'),
+    ('application/pdf', 'public, max-age=300'),
+    ('application/octet-stream', 'public, max-age=300')
+]
 
 # Projects data
 projects = {
@@ -119,10 +218,122 @@ THEMES = {
 # Default theme
 THEME = THEMES['light']
 
+class InventoryEntry(NamedTuple):
+    path: Path
+    is_dir: bool
+    stat: os.stat_result
+
+class SiteInventory:
+    """A single os.scandir pass over the content directories, with stat info, shared by every generator."""
+
+    def __init__(self, roots: List[Path]):
+        self.dirs: Dict[Path, List[InventoryEntry]] = {}
+        self.stats: Dict[Path, os.stat_result] = {}
+        for root in roots:
+            self.scan(root)
+
+    def scan(self, folder: Path):
+        """Read a directory tree into the inventory."""
+        try:
+            with os.scandir(folder) as it:
+                entries = [InventoryEntry(folder / entry.name, entry.is_dir(), entry.stat()) for entry in it]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        entries.sort(key=lambda entry: entry.path.name)
+        self.dirs[folder] = entries
+        for entry in entries:
+            self.stats[entry.path] = entry.stat
+            if entry.is_dir:
+                self.scan(entry.path)
+
+    def forget(self, folder: Path):
+        for entry in self.dirs.pop(folder, []):
+            self.stats.pop(entry.path, None)
+            if entry.is_dir:
+                self.forget(entry.path)
+
+    def refresh(self, folder: Path):
+        """Re-read a directory tree after the build wrote into it."""
+        self.forget(folder)
+        self.scan(folder)
+
+    def update(self, path: Path):
+        """Re-stat a single file the build wrote."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.stats.pop(path, None)
+            if path.parent in self.dirs:
+                self.dirs[path.parent] = [entry for entry in self.dirs[path.parent] if entry.path != path]
+            return
+        self.stats[path] = stat
+        if path.parent in self.dirs:
+            entries = [entry for entry in self.dirs[path.parent] if entry.path != path]
+            entries.append(InventoryEntry(path, False, stat))
+            self.dirs[path.parent] = sorted(entries, key=lambda entry: entry.path.name)
+
+    def is_dir(self, path: Path) -> bool:
+        return path in self.dirs
+
+    def exists(self, path: Path) -> bool:
+        return path in self.stats or path in self.dirs
+
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        return self.stats.get(path)
+
+    def listdir(self, folder: Path) -> List[InventoryEntry]:
+        return self.dirs.get(folder, [])
+
+    def files(self, folder: Path, suffixes: Optional[List[str]] = None) -> List[Path]:
+        """List the files directly in a folder, optionally only those with the given suffixes."""
+        return [entry.path for entry in self.listdir(folder)
+                if not entry.is_dir and (suffixes is None or entry.path.suffix in suffixes)]
+
+    def walk_files(self, folder: Path) -> List[Path]:
+        """List every file below a folder, in a stable order."""
+        files = self.files(folder)
+        for entry in self.listdir(folder):
+            if entry.is_dir:
+                files.extend(self.walk_files(entry.path))
+        return files
+
+_inventory: Optional[SiteInventory] = None
+
+def get_inventory() -> SiteInventory:
+    """Get the inventory of archive/, toolbox/ and ghx_content/, scanning them on first use."""
+    global _inventory
+    if _inventory is None:
+        _inventory = SiteInventory([ARCHIVE_DIR, TOOLBOX_DIR, OUTPUT_DIR / 'ghx_content'])
+    return _inventory
+
+def reset_inventory():
+    """Forget the inventory, and what was derived from it, so the next query rescans the content directories."""
+    global _inventory, _project_entries
+    _inventory = None
+    _project_entries = None
+    get_tools_dict.cache_clear()
+
+def set_site_root(root: Path):
+    """Build the site in another directory, such as a synthetic benchmark corpus."""
+    global SITE_ROOT, ARCHIVE_DIR, TOOLBOX_DIR, OUTPUT_DIR, BUILD_DIR, BUILD_MANIFEST_PATH, BUILD_REPORT_PATH
+    global DERIVATIVES_DIR, FRAGMENTS_DIR, IMAGE_CACHE_DIR, GHX_HIGHLIGHT_CACHE_DIR
+    SITE_ROOT = Path(root)
+    ARCHIVE_DIR = SITE_ROOT / 'archive'
+    TOOLBOX_DIR = SITE_ROOT / 'toolbox'
+    OUTPUT_DIR = SITE_ROOT
+    BUILD_DIR = SITE_ROOT / '.build'
+    BUILD_MANIFEST_PATH = BUILD_DIR / 'manifest.json'
+    BUILD_REPORT_PATH = BUILD_DIR / 'report.json'
+    DERIVATIVES_DIR = SITE_ROOT / 'derivatives'
+    FRAGMENTS_DIR = SITE_ROOT / 'fragments'
+    IMAGE_CACHE_DIR = BUILD_DIR / 'image_cache'
+    GHX_HIGHLIGHT_CACHE_DIR = BUILD_DIR / 'ghx_highlight'
+    reset_inventory()
+
 def get_tool_description(tool_name: str) -> str:
     """Get the description from the tool's readme file."""
     readme_path = TOOLBOX_DIR / f"{tool_name}_readme.txt"
-    if readme_path.exists():
+    if get_inventory().exists(readme_path):
         with open(readme_path, 'r') as f:
             content = f.read().strip().split('\n')
             # Return the last non-empty line as the description
@@ -132,28 +343,184 @@ def get_tool_description(tool_name: str) -> str:
                     return line.strip().lower()
     return "a powerful toolkit that transforms complex operations into simple workflows."
 
-def convert_pdf_to_preview(pdf_path: Path) -> List[Path]:
-    """Check for existing previews in the preview directory."""
+def rasterize_pdf_pages(pdf_path: str, pages: List[int], dpi: int, preview_dir: str) -> List[str]:
+    """Render PDF pages to PNG previews, one page at a time.
+
+    Runs in a worker process. pdftoppm writes each page straight to disk, so no page is
+    decoded into Python, and each preview appears as soon as its page is done.
+    """
+    import tempfile
+    from pdf2image import convert_from_path
+
+    pdf_stem = Path(pdf_path).stem
+    written = []
+    with tempfile.TemporaryDirectory(dir=preview_dir) as tmp_dir:
+        for page in pages:
+            rendered = convert_from_path(pdf_path, dpi=dpi, first_page=page, last_page=page,
+                                         output_folder=tmp_dir, output_file=f'page_{page:05d}',
+                                         single_file=True, fmt='png', paths_only=True)
+            preview_path = Path(preview_dir) / f'{pdf_stem}_{page:03d}.png'
+            os.replace(rendered[0], preview_path)
+            written.append(str(preview_path))
+    return written
+
+def hash_pdf_object(obj, digest, seen: set):
+    """Feed a PDF object and everything it references into a digest, visiting shared objects once."""
+    from pypdf.generic import IndirectObject, StreamObject
+
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key in seen:
+            digest.update(f"ref{key}".encode())
+            return
+        seen.add(key)
+        obj = obj.get_object()
+    if isinstance(obj, StreamObject):
+        digest.update(obj.get_data())
+    if isinstance(obj, dict):
+        for name in sorted(obj):
+            if name != '/Parent':
+                digest.update(str(name).encode())
+                hash_pdf_object(obj[name], digest, seen)
+    elif isinstance(obj, list):
+        for item in obj:
+            hash_pdf_object(item, digest, seen)
+    elif not isinstance(obj, StreamObject):
+        digest.update(repr(obj).encode())
+
+def get_pdf_page_fingerprints(pdf_path: Path) -> Optional[List[str]]:
+    """Fingerprint each page of a PDF by its content stream, resources and page box.
+
+    Returns None when pypdf is not installed or the file cannot be parsed.
+    """
+    import hashlib
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    try:
+        reader = PdfReader(str(pdf_path))
+        fingerprints = []
+        for page in reader.pages:
+            digest = hashlib.sha256()
+            contents = page.get_contents()
+            if contents is not None:
+                digest.update(contents.get_data())
+            digest.update(repr([float(value) for value in page.mediabox]).encode())
+            hash_pdf_object(page.get('/Resources'), digest, set())
+            fingerprints.append(digest.hexdigest())
+        return fingerprints
+    except Exception as e:
+        logger.warning(f"Could not fingerprint the pages of {pdf_path}: {e}")
+        return None
+
+def convert_pdf_to_preview(pdf_path: Path, dpi: Optional[int] = None, manifest: Optional['BuildManifest'] = None) -> List[Path]:
+    """Rasterize the pages of a PDF that changed or have no preview yet and return all of its previews.
+
+    A sidecar previews/<stem>.pages.json keeps the document hash and a fingerprint per page, so
+    re-exporting a presentation only re-renders the pages whose content changed. With a manifest,
+    an unchanged PDF is recognized by its size and mtime instead of being hashed again.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from pdf2image import pdfinfo_from_path
+    from pdf2image.exceptions import PDFInfoNotInstalledError, PDFPageCountError, PDFSyntaxError
+
+    dpi = dpi or PDF_PREVIEW_DPI
     preview_dir = pdf_path.parent / 'previews'
-    if preview_dir.exists():
-        existing_previews = sorted(preview_dir.glob(f'{pdf_path.stem}_*.png'))
-        if existing_previews:
-            logger.info(f"Using existing previews for {pdf_path}")
-            return existing_previews
-    return []
-
-def get_first_image(folder_path: Path) -> Optional[Path]:
+    sidecar_path = preview_dir / f'{pdf_path.stem}.pages.json'
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        sidecar = None
+
+    document_hash = manifest.fingerprint(pdf_path) if manifest else hash_file(pdf_path)
+    if sidecar and sidecar['document'] == document_hash and sidecar['dpi'] == dpi:
+        fingerprints = sidecar['pages']
+        changed_pages = [page for page, fingerprint in enumerate(fingerprints, 1) if fingerprint is None]
+    else:
+        fingerprints = get_pdf_page_fingerprints(pdf_path)
+        if fingerprints is None:
+            # Without per-page fingerprints, a changed document invalidates every page
+            try:
+                page_count = pdfinfo_from_path(str(pdf_path))['Pages']
+            except (PDFInfoNotInstalledError, PDFPageCountError, PDFSyntaxError) as e:
+                logger.warning(f"Could not read {pdf_path}, using existing previews only: {e}")
+                page_count = 0
+            fingerprints = [document_hash] * page_count
+        if sidecar is None:
+            # Previews made before the sidecar existed are trusted as they are
+            changed_pages = []
+        else:
+            previous = sidecar['pages'] if sidecar['dpi'] == dpi else []
+            changed_pages = [page for page, fingerprint in enumerate(fingerprints, 1)
+                             if page > len(previous) or previous[page - 1] != fingerprint]
+
+    inventory = get_inventory()
+    page_count = len(fingerprints)
+    missing_pages = {page for page in range(1, page_count + 1)
+                     if not inventory.exists(preview_dir / f'{pdf_path.stem}_{page:03d}.png')}
+    pages_to_render = sorted(set(changed_pages) | missing_pages)
+    # Drop previews of pages that no longer exist in the document
+    stale_previews = [path for path in get_pdf_previews(pdf_path)
+                      if page_count and int(path.stem[len(pdf_path.stem) + 1:]) > page_count]
+    for path in stale_previews:
+        path.unlink()
+
+    if pages_to_render:
+        preview_dir.mkdir(exist_ok=True)
+        # Split the pages into contiguous ranges, one per worker
+        workers = min(len(pages_to_render), os.cpu_count() or 1)
+        chunk_size = -(-len(pages_to_render) // workers)
+        ranges = [pages_to_render[i:i + chunk_size] for i in range(0, len(pages_to_render), chunk_size)]
+        logger.info(f"Rasterizing {len(pages_to_render)} of {page_count} pages of {pdf_path} at {dpi} dpi with {len(ranges)} workers")
+        fingerprints = list(fingerprints)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = {executor.submit(rasterize_pdf_pages, str(pdf_path), pages, dpi, str(preview_dir)): pages
+                       for pages in ranges}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error rasterizing {pdf_path}: {e}")
+                    # Leave the pages unfingerprinted so the next build retries them
+                    for page in futures[future]:
+                        fingerprints[page - 1] = None
+    elif page_count:
+        logger.info(f"Using existing previews for {pdf_path}")
+
+    if page_count and (sidecar is None or pages_to_render or sidecar['document'] != document_hash or sidecar['dpi'] != dpi):
+        preview_dir.mkdir(exist_ok=True)
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump({'document': document_hash, 'dpi': dpi, 'pages': fingerprints}, f, indent=1)
+    if pages_to_render or stale_previews:
+        inventory.refresh(pdf_path.parent)
+
+    return get_pdf_previews(pdf_path)
+
+def get_pdf_previews(pdf_path: Path) -> List[Path]:
+    """List the page previews rendered for a PDF."""
+    prefix = f'{pdf_path.stem}_'
+    return [path for path in get_inventory().files(pdf_path.parent / 'previews', ['.png'])
+            if path.stem.startswith(prefix) and path.stem[len(prefix):].isdigit()]
+
+def get_first_image(folder_path: Path, manifest: Optional['BuildManifest'] = None) -> Optional[Path]:
     """Get the first image (jpg, gif, or png) from a folder."""
+    inventory = get_inventory()
     for ext in ['.jpg', '.jpeg', '.gif', '.png']:
-        for file in folder_path.glob(f'*{ext}'):
+        for file in inventory.files(folder_path, [ext]):
             return file
     # If no image found, look for PDF and convert
-    for pdf in folder_path.glob('*.pdf'):
-        return convert_pdf_to_preview(pdf)[0]
+    for pdf in inventory.files(folder_path, ['.pdf']):
+        previews = convert_pdf_to_preview(pdf, manifest=manifest)
+        if previews:
+            return previews[0]
     return None
 
 def create_placeholder_readme(folder_path: Path) -> str:
     """Create a placeholder readme.txt if it doesn't exist."""
+    import random
+
     readme_path = folder_path / 'readme.txt'
     if not readme_path.exists():
         description = random.choice(TOOL_DESCRIPTIONS)
@@ -163,18 +530,6 @@ def create_placeholder_readme(folder_path: Path) -> str:
     with open(readme_path, 'r') as f:
         return f.read().strip()
 
-def read_ghx_file(ghx_path: Path) -> str:
-    """Read and format GHX file content."""
-    try:
-        if not ghx_path.exists():
-            return "File not found"
-        with open(ghx_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return content
-    except Exception as e:
-        logger.error(f"Error reading GHX file: {e}")
-        return f"Error reading file: {str(e)}"
-
 def get_navigation(current_page: str) -> str:
     """Generate the navigation buttons and theme toggle."""
     pages = {
@@ -251,24 +606,31 @@ def get_navigation(current_page: str) -> str:
         </div>
     </div>'''
 
-def get_all_images(folder_path: Path) -> List[Path]:
+def get_images_by_extension(folder_path: Path) -> List[Path]:
+    """List the images directly in a folder, grouped in IMAGE_EXTENSIONS order."""
+    files = get_inventory().files(folder_path, IMAGE_EXTENSIONS)
+    return [f for ext in IMAGE_EXTENSIONS for f in files if f.suffix == ext]
+
+def get_all_images(folder_path: Path, manifest: Optional['BuildManifest'] = None) -> List[Path]:
     """Get all images (jpg, gif, png) from a folder."""
-    images = []
-    
+    inventory = get_inventory()
+
+    # Rasterize any presentation PDFs into the previews directory
+    for pdf in inventory.files(folder_path, ['.pdf']):
+        convert_pdf_to_preview(pdf, manifest=manifest)
+
     # First check if there's a previews directory
     previews_dir = folder_path / 'previews'
-    if previews_dir.exists():
+    if inventory.is_dir(previews_dir):
         # If previews directory exists, use those files
-        for ext in ['.jpg', '.jpeg', '.gif', '.png', '.JPG', '.JPEG', '.GIF', '.PNG']:
-            images.extend(previews_dir.glob(f'*{ext}'))
+        images = get_images_by_extension(previews_dir)
     else:
         # If no previews directory, use files from main directory
-        for ext in ['.jpg', '.jpeg', '.gif', '.png', '.JPG', '.JPEG', '.GIF', '.PNG']:
-            images.extend([
-                f for f in folder_path.glob(f'*{ext}')
-                if f.name != 'preview.png'  # Exclude old preview files
-                and not f.stem.endswith('_presentation')  # Exclude presentation exports
-            ])
+        images = [
+            f for f in get_images_by_extension(folder_path)
+            if f.name != 'preview.png'  # Exclude old preview files
+            and not f.stem.endswith('_presentation')  # Exclude presentation exports
+        ]
     
     # Sort images naturally (so 1.jpg comes before 10.jpg)
     def natural_sort_key(path):
@@ -285,6 +647,320 @@ def get_all_images(folder_path: Path) -> List[Path]:
     
     return sorted_images
 
+def import_pillow():
+    """Import Pillow on first use, so only builds that touch images pay for it."""
+    from PIL import Image, ImageOps
+    # Presentation boards are far larger than Pillow's default decompression bomb limit
+    Image.MAX_IMAGE_PIXELS = None
+    return Image, ImageOps
+
+def get_display_size(img: 'Image.Image') -> tuple:
+    """Get an image's size after applying its EXIF orientation."""
+    width, height = img.size
+    if img.getexif().get(0x0112) in (5, 6, 7, 8):
+        return height, width
+    return width, height
+
+def derivative_prefix(source: Path) -> Path:
+    """Get the path prefix shared by every resized copy of a source image."""
+    rel_path = source.relative_to(SITE_ROOT)
+    return DERIVATIVES_DIR / rel_path.parent / f"{source.stem}-{source.suffix[1:].lower()}-"
+
+def derivative_path(source: Path, width: int, ext: str) -> Path:
+    """Get where the resized copy of a source image is written."""
+    prefix = derivative_prefix(source)
+    return prefix.with_name(f"{prefix.name}{width}w{ext}")
+
+@functools.lru_cache(maxsize=None)
+def get_modern_formats() -> tuple:
+    """Get the modern image formats the installed Pillow can encode."""
+    try:
+        import pillow_avif  # noqa: F401 - registers AVIF support on Pillow versions without it
+    except ImportError:
+        pass
+    Image, _ = import_pillow()
+    Image.init()
+    return tuple(fmt for fmt in MODERN_IMAGE_FORMATS if fmt.upper() in Image.SAVE)
+
+def get_image_options(options: Optional[Dict] = None) -> Dict:
+    """Add the image settings to a stage's options, so changing them re-runs the stages that embed images."""
+    return {**(options or {}), 'image_formats': list(get_modern_formats()), 'image_quality': dict(IMAGE_QUALITY),
+            'pdf_dpi': PDF_PREVIEW_DPI}
+
+def derivative_cache_name(source_hash: str, width: int, image_format: str, quality: Optional[int]) -> str:
+    """Get the content-addressed cache file name for one encoded derivative."""
+    import hashlib
+    key = hashlib.sha256(f"{source_hash}:{width}:{image_format}:{quality}".encode()).hexdigest()
+    return f"{key}{IMAGE_FORMAT_EXTENSIONS[image_format]}"
+
+def save_derivative(frame: 'Image.Image', path: Path, image_format: str, quality: Optional[int]):
+    """Encode one derivative with the settings for its format."""
+    if image_format == 'png':
+        frame.save(path, 'PNG', optimize=True)
+    elif image_format == 'jpeg':
+        frame.save(path, 'JPEG', quality=quality, optimize=True, progressive=True)
+    elif image_format == 'webp':
+        frame.save(path, 'WEBP', quality=quality, method=6)
+    else:
+        frame.save(path, image_format.upper(), quality=quality)
+
+def encode_image_derivatives(source: str, source_hash: str, widths: List[int], formats: List[str],
+                             quality: Dict[str, int], cache_dir: str) -> Dict:
+    """Encode the width tiers of one image, in each format, into the derivative cache.
+
+    Runs in a worker process, so it only takes picklable arguments. Files already in the cache
+    are not re-encoded. Animated images are left alone and get no derivatives. Opaque images
+    fall back to JPEG, transparent ones to PNG.
+    """
+    Image, ImageOps = import_pillow()
+    get_modern_formats()  # Register optional encoder plugins in this process
+    cache_dir = Path(cache_dir)
+    with Image.open(source) as img:
+        if getattr(img, 'is_animated', False):
+            return {'fallback': None, 'formats': {}}
+        source_width, source_height = get_display_size(img)
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+        fallback = 'png' if has_alpha else 'jpeg'
+        image_formats = list(formats) + [fallback]
+
+        # Never upscale: tiers wider than the source collapse to the source width
+        targets = sorted({min(width, source_width) for width in widths}, reverse=True)
+        files = {
+            fmt: {width: derivative_cache_name(source_hash, width, fmt, quality.get(fmt)) for width in targets}
+            for fmt in image_formats
+        }
+        missing = [width for width in targets
+                   if not all((cache_dir / files[fmt][width]).exists() for fmt in image_formats)]
+        if missing:
+            # Let JPEG decode at a reduced scale that is still at least as large as the biggest target
+            img.draft('RGB', (missing[0], missing[0]))
+            frame = ImageOps.exif_transpose(img)
+            frame = frame.convert('RGBA' if has_alpha else 'RGB')
+            for width in missing:
+                height = max(1, round(source_height * width / source_width))
+                frame = frame.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+                for fmt in image_formats:
+                    path = cache_dir / files[fmt][width]
+                    if path.exists():
+                        continue
+                    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                    save_derivative(frame, tmp_path, fmt, quality.get(fmt))
+                    os.replace(tmp_path, path)
+    return {'fallback': fallback, 'formats': files}
+
+class DerivativeCache:
+    """Content-addressed store of encoded derivatives with size-bounded LRU eviction.
+
+    Files are keyed on (source hash, width, format, quality). The index also remembers which
+    files each source produced, so unchanged images are resolved without opening them.
+    """
+
+    def __init__(self, path: Path = None, max_bytes: int = None):
+        self.path = path or IMAGE_CACHE_DIR
+        self.max_bytes = IMAGE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.index_path = self.path / 'index.json'
+        self.plans: Dict[str, Dict] = {}
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.plans = data.get('plans', {})
+            self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def plan_key(source_hash: str, widths: List[int], formats: List[str], quality: Dict[str, int]) -> str:
+        settings = ','.join(f"{fmt}={quality.get(fmt)}" for fmt in list(formats) + ['jpeg'])
+        return f"{source_hash}:{','.join(map(str, widths))}:{settings}"
+
+    @staticmethod
+    def plan_files(plan: Dict) -> List[str]:
+        return [name for files in plan['formats'].values() for name in files.values()]
+
+    def lookup(self, plan_key: str) -> Optional[Dict]:
+        """Get the cached derivatives for a plan if all of its files are still present."""
+        plan = self.plans.get(plan_key)
+        if plan is None or not all((self.path / name).exists() for name in self.plan_files(plan)):
+            return None
+        self.touch(self.plan_files(plan))
+        return plan
+
+    def store(self, plan_key: str, plan: Dict):
+        """Remember the files a plan produced."""
+        self.plans[plan_key] = plan
+        self.touch(self.plan_files(plan))
+
+    def touch(self, names):
+        now = time.time()
+        for name in names:
+            self.entries[name] = {'size': (self.path / name).stat().st_size, 'last_used': now}
+
+    def evict(self):
+        """Delete least recently used files until the cache fits in its size budget."""
+        total = sum(entry['size'] for entry in self.entries.values())
+        evicted = set()
+        for name, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            (self.path / name).unlink(missing_ok=True)
+            total -= entry['size']
+            evicted.add(name)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} files from the image cache")
+            self.entries = {name: entry for name, entry in self.entries.items() if name not in evicted}
+            self.plans = {key: plan for key, plan in self.plans.items()
+                          if not evicted.intersection(self.plan_files(plan))}
+
+    def save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'plans': self.plans, 'entries': self.entries}, f)
+        os.replace(tmp_path, self.index_path)
+
+def publish_derivative(cache_file: Path, path: Path):
+    """Expose a cached derivative at its public path, hardlinking when possible."""
+    if path.exists():
+        if path.samefile(cache_file):
+            return
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(cache_file, path)
+    except OSError:
+        import shutil
+        shutil.copyfile(cache_file, path)
+
+def prune_derivatives(manifest: 'BuildManifest') -> List[Path]:
+    """Delete published derivatives that no current stage references, such as those of deleted or renamed images.
+
+    The cached copies stay in the image cache, where LRU eviction can now actually free their space.
+    """
+    referenced = {SITE_ROOT / key for record in manifest.stages.values() for key in record['outputs']}
+    removed = []
+    for folder, _, files in os.walk(DERIVATIVES_DIR, topdown=False):
+        for name in files:
+            path = Path(folder) / name
+            if path not in referenced:
+                path.unlink()
+                removed.append(path)
+        if folder != str(DERIVATIVES_DIR) and not os.listdir(folder):
+            os.rmdir(folder)
+    if removed:
+        logger.info(f"Removed {len(removed)} derivatives of images that are no longer used")
+    return removed
+
+def create_image_derivatives(requests: List[tuple], manifest: Optional['BuildManifest'] = None) -> Dict[tuple, Dict]:
+    """Create the resized derivatives for (image, widths) requests, encoding cache misses in parallel.
+
+    Returns a mapping from (image, tuple(widths)) to {'fallback': format, 'formats': {format: {width: path}},
+    'version': source version, 'versions': {path: derivative version}}, with formats ordered from most to
+    least preferred. Versions are content hash prefixes for the ?v= query of asset URLs.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    formats = list(get_modern_formats())
+    fingerprint = manifest.fingerprint if manifest else hash_file
+    cache = DerivativeCache()
+    cache.path.mkdir(parents=True, exist_ok=True)
+
+    plans = {}
+    misses = {}
+    source_hashes = {}
+    for image, widths in requests:
+        key = (image, tuple(widths))
+        if key in plans or key in misses:
+            continue
+        source = SITE_ROOT / image
+        try:
+            source_hash = fingerprint(source)
+        except OSError as e:
+            logger.warning(f"Could not read {image}: {e}")
+            source_hash = None
+        source_hashes[key] = source_hash
+        if source_hash is None:
+            plans[key] = None
+            continue
+        plan_key = cache.plan_key(source_hash, widths, formats, IMAGE_QUALITY)
+        plan = cache.lookup(plan_key)
+        if plan is not None:
+            plans[key] = plan
+        else:
+            misses[key] = (source, source_hash, plan_key)
+
+    if misses:
+        workers = min(len(misses), os.cpu_count() or 1)
+        logger.info(f"Encoding derivatives for {len(misses)} images with {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(encode_image_derivatives, str(source), source_hash, list(key[1]),
+                                formats, IMAGE_QUALITY, str(cache.path)): key
+                for key, (source, source_hash, plan_key) in misses.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    plan = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not create derivatives for {key[0]}: {e}")
+                    plans[key] = None
+                    continue
+                cache.store(misses[key][2], plan)
+                plans[key] = plan
+
+    derivatives = {}
+    for key, plan in plans.items():
+        source_hash = source_hashes[key]
+        derivatives[key] = {'fallback': None, 'formats': {}, 'versions': {},
+                            'version': source_hash[:ASSET_VERSION_LENGTH] if source_hash else None}
+        if not plan or not plan['formats']:
+            continue
+        source = SITE_ROOT / key[0]
+        derivatives[key]['fallback'] = plan['fallback']
+        for fmt, files in plan['formats'].items():
+            derivatives[key]['formats'][fmt] = {}
+            for width, name in files.items():
+                path = derivative_path(source, int(width), IMAGE_FORMAT_EXTENSIONS[fmt])
+                publish_derivative(cache.path / name, path)
+                derivatives[key]['formats'][fmt][int(width)] = path
+                # Cache names are already content-addressed
+                derivatives[key]['versions'][path] = name[:ASSET_VERSION_LENGTH]
+
+    cache.evict()
+    cache.save()
+    return derivatives
+
+def versioned_url(path: str, version: Optional[str]) -> str:
+    """Quote a site-relative path and append its ?v= content version, when known."""
+    from urllib.parse import quote
+    return f"{quote(path)}?v={version}" if version else quote(path)
+
+def get_image_url(image: str, derivatives: Dict) -> str:
+    """Get the versioned URL of a source image, for full-size views and downloads."""
+    return versioned_url(image, derivatives['version'])
+
+def get_derivative_url(path: Path, derivatives: Dict) -> str:
+    """Get the versioned URL of one resized copy of an image."""
+    return versioned_url(path.relative_to(SITE_ROOT).as_posix(), derivatives['versions'].get(path))
+
+def get_srcset(files: Dict[int, Path], derivatives: Dict) -> str:
+    """Build a srcset value from {width: path}."""
+    return ', '.join(f"{get_derivative_url(files[width], derivatives)} {width}w" for width in sorted(files))
+
+def render_picture(image: str, derivatives: Dict, sizes: str, attributes: str) -> str:
+    """Render a <picture> offering the modern formats of an image, falling back to an <img>."""
+    fallback = derivatives['fallback']
+    if not fallback:
+        return f'<img src="{get_image_url(image, derivatives)}" {attributes}>'
+    sources = ''.join(
+        f'<source type="{IMAGE_MIME_TYPES[fmt]}" srcset="{get_srcset(files, derivatives)}" sizes="{sizes}">'
+        for fmt, files in derivatives['formats'].items() if fmt != fallback
+    )
+    files = derivatives['formats'][fallback]
+    src = get_derivative_url(files[max(files)], derivatives)
+    return f'<picture>{sources}<img src="{src}" srcset="{get_srcset(files, derivatives)}" sizes="{sizes}" {attributes}></picture>'
+
 def get_shared_search_js():
     """Generate the shared JavaScript code for search functionality."""
     return '''
@@ -371,30 +1047,36 @@ def get_shared_search_js():
         }
     });'''
 
-# Tools data
-tools_dict = {}
-for tool_dir in TOOLBOX_DIR.iterdir():
-    if tool_dir.is_dir():
-        gh_file = next(tool_dir.glob('*.gh'), None)
-        ghx_file = next(tool_dir.glob('*.ghx'), None)
-        if ghx_file:
-            description = get_tool_description(tool_dir.name)
-            tools_dict[tool_dir.name] = {
-                'description': description,
-                'tags': ['grasshopper']  # Default tag
-            }
-    elif tool_dir.suffix == '.ghx':
-        description = get_tool_description(tool_dir.stem)
-        tools_dict[tool_dir.stem] = {
-            'description': description,
+def find_tool_files() -> List[tuple]:
+    """Find (name, gh_file, ghx_file) for every tool in the toolbox directory, in name order."""
+    inventory = get_inventory()
+    found = []
+    for entry in inventory.listdir(TOOLBOX_DIR):
+        if entry.is_dir:
+            gh_file = next(iter(inventory.files(entry.path, ['.gh'])), None)
+            ghx_file = next(iter(inventory.files(entry.path, ['.ghx'])), None)
+            if ghx_file:
+                found.append((entry.path.name, gh_file, ghx_file))
+        elif entry.path.suffix == '.ghx':
+            found.append((entry.path.stem, None, entry.path))
+    return found
+
+@functools.lru_cache(maxsize=1)
+def get_tools_dict() -> Dict[str, Dict]:
+    """Get the description and tags of every tool, discovered on first use."""
+    tools_dict = {}
+    for tool_name, _, _ in find_tool_files():
+        tools_dict[tool_name] = {
+            'description': get_tool_description(tool_name),
             'tags': ['grasshopper']  # Default tag
         }
 
-# Add specific tags to tools
-if 'illinois_institute_of_technology_truss_system' in tools_dict:
-    tools_dict['illinois_institute_of_technology_truss_system']['tags'].append('kangaroo')
-if 'lego_bridge_aggregation' in tools_dict:
-    tools_dict['lego_bridge_aggregation']['tags'].append('wasp')
+    # Add specific tags to tools
+    if 'illinois_institute_of_technology_truss_system' in tools_dict:
+        tools_dict['illinois_institute_of_technology_truss_system']['tags'].append('kangaroo')
+    if 'lego_bridge_aggregation' in tools_dict:
+        tools_dict['lego_bridge_aggregation']['tags'].append('wasp')
+    return tools_dict
 
 def generate_index_html():
     """Generate the landing page."""
@@ -550,9 +1232,9 @@ def generate_index_html():
     </div>
     <script>
         const projects = {projects};  // Make projects data available
-        const tools = {tools_dict};  // Make tools data available
+        const tools = {get_tools_dict()};  // Make tools data available
         
-        {get_theme_toggle_js()}
+        {get_theme_toggle_js()}{get_live_reload_js()}
         
         function updateClock() {{
             const now = new Date();
@@ -575,6 +1257,143 @@ def generate_index_html():
     with open(OUTPUT_DIR / "index.html", "w") as f:
         f.write(html)
 
+def get_ghx_viewer_styles():
+    """Generate the CSS for the paged GHX code viewer and its build-time highlighting."""
+    return '''
+        .ghx-viewer {
+            position: relative;
+            padding: 0;
+            line-height: 1.25rem;
+            overflow: auto;
+        }
+        
+        .ghx-page {
+            position: absolute;
+            left: 0;
+            padding: 0 1rem;
+            white-space: pre;
+        }
+        
+        .ghx-tag {
+            color: var(--accent);
+        }
+        
+        .ghx-attr, .ghx-comment, .ghx-cdata {
+            opacity: 0.6;
+        }
+        
+        .ghx-comment {
+            font-style: italic;
+        }
+        
+        .ghx-value {
+            font-weight: 600;
+        }
+    '''
+
+def get_ghx_viewer_js():
+    """Generate the paged GHX viewer, which only fetches and renders the pages scrolled into view."""
+    return '''
+        // Paged GHX viewer: pages.json sizes the scroll area, and only the pages in view are fetched and kept in the DOM
+        const ghxViewers = new Map();
+        
+        function openGhxViewer(container, toolName) {
+            if (ghxViewers.has(container)) {
+                return ghxViewers.get(container).ready;
+            }
+            const viewer = { toolName, pages: new Map(), rendered: new Map(), scheduled: false };
+            container.textContent = '';
+            container.classList.add('ghx-viewer');
+            const spacer = document.createElement('div');
+            container.appendChild(spacer);
+            viewer.ready = fetch(`ghx_content/${toolName}/pages.json`)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+                    return response.json();
+                })
+                .then(index => {
+                    viewer.index = index;
+                    viewer.lineHeight = parseFloat(getComputedStyle(container).lineHeight) || 20;
+                    spacer.style.height = `${index.lines * viewer.lineHeight}px`;
+                    container.addEventListener('scroll', () => {
+                        if (!viewer.scheduled) {
+                            viewer.scheduled = true;
+                            requestAnimationFrame(() => {
+                                viewer.scheduled = false;
+                                renderGhxPages(container, viewer);
+                            });
+                        }
+                    });
+                    return renderGhxPages(container, viewer);
+                })
+                .catch(error => {
+                    ghxViewers.delete(container);
+                    container.classList.remove('ghx-viewer');
+                    throw error;
+                });
+            ghxViewers.set(container, viewer);
+            return viewer.ready;
+        }
+        
+        // Index of the page holding a line; pages are [byte offset, first line] in order
+        function ghxPageAt(pages, line) {
+            let low = 0;
+            let high = pages.length - 1;
+            while (low < high) {
+                const middle = (low + high + 1) >> 1;
+                if (pages[middle][1] <= line) {
+                    low = middle;
+                } else {
+                    high = middle - 1;
+                }
+            }
+            return low;
+        }
+        
+        function renderGhxPages(container, viewer) {
+            const pages = viewer.index.pages;
+            const first = ghxPageAt(pages, Math.floor(container.scrollTop / viewer.lineHeight));
+            const last = ghxPageAt(pages, Math.ceil((container.scrollTop + container.clientHeight) / viewer.lineHeight));
+            // One page of margin on each side keeps short scrolls from showing blank lines
+            const wanted = new Set();
+            for (let page = Math.max(0, first - 1); page <= Math.min(pages.length - 1, last + 1); page++) {
+                wanted.add(page);
+            }
+            viewer.wanted = wanted;
+            viewer.rendered.forEach((element, page) => {
+                if (!wanted.has(page)) {
+                    element.remove();
+                    viewer.rendered.delete(page);
+                }
+            });
+            return Promise.all([...wanted].map(page => {
+                if (!viewer.pages.has(page)) {
+                    const name = String(page).padStart(4, '0');
+                    viewer.pages.set(page, fetch(`ghx_content/${viewer.toolName}/${name}.html`).then(response => {
+                        if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+                        return response.text();
+                    }).catch(error => {
+                        viewer.pages.delete(page);
+                        throw error;
+                    }));
+                }
+                return viewer.pages.get(page).then(text => {
+                    // Skip pages already shown, or scrolled away while they were loading
+                    if (viewer.rendered.has(page) || !viewer.wanted.has(page)) {
+                        return;
+                    }
+                    const element = document.createElement('div');
+                    element.className = 'ghx-page';
+                    element.style.top = `${pages[page][1] * viewer.lineHeight}px`;
+                    // Pages are highlighted and escaped at build time
+                    element.innerHTML = text;
+                    container.appendChild(element);
+                    viewer.rendered.set(page, element);
+                });
+            }));
+        }
+    '''
+
 def get_highlight_styles():
     """Generate the CSS styles for highlighting search results."""
     return f'''
@@ -668,8 +1487,18 @@ def get_highlighting_js():
         window.addEventListener('hashchange', highlightSearchResults);
     '''
 
-def generate_archive_html():
-    """Generate the archive page."""
+_project_entries: Optional[List[tuple]] = None
+
+def get_project_entries(manifest: Optional['BuildManifest'] = None) -> List[tuple]:
+    """Get the project entries, discovering the images (and rasterizing PDFs) once per inventory scan."""
+    global _project_entries
+    if _project_entries is None:
+        with build_stage('image discovery'):
+            _project_entries = find_project_entries(manifest)
+    return _project_entries
+
+def find_project_entries(manifest: Optional['BuildManifest'] = None) -> List[tuple]:
+    """Collect (name, data, thumbnail, images) for every project folder that has images."""
     # Define custom image orders for projects
     project_image_orders = {
         'ad_barnes_nature_reserve': [
@@ -702,17 +1531,12 @@ def generate_archive_html():
         ]
     }
 
-    # Get all unique tags
-    all_tags = set()
-    for project_data in projects.values():
-        all_tags.update(project_data['tags'])
-    all_tags = sorted(all_tags)
-    
-    project_items = []
+    inventory = get_inventory()
+    project_entries = []
     for project_name, project_data in projects.items():
         project_dir = ARCHIVE_DIR / project_name
-        if project_dir.is_dir():
-            images = get_all_images(project_dir)
+        if inventory.is_dir(project_dir):
+            images = get_all_images(project_dir, manifest)
             project_images = [str(img.relative_to(SITE_ROOT)) for img in images]
             
             # Debug logging for chil_bookshelf
@@ -736,9 +1560,6 @@ def generate_archive_html():
                 remaining_images = [img for img in project_images if img not in ordered_images]
                 project_images = ordered_images + remaining_images
                 
-                # Add cache-busting for con_doc.jpg and view_1.jpeg
-                project_images = [f"{img}?t={int(datetime.now().timestamp())}" if 'con_doc.jpg' in img or 'view_1.jpeg' in img else img for img in project_images]
-                
                 logger.info(f"Final ordered images for chil_bookshelf: {project_images}")
             elif project_name == 'icosahedron_explosion':
                 # For icosahedron_explosion, use only the first image as both thumbnail and content
@@ -747,8 +1568,8 @@ def generate_archive_html():
             elif project_name == 'illinois_institute_of_technology_dorms':
                 # Get all PNGs from the preview directory
                 preview_dir = project_dir / 'previews'
-                if preview_dir.exists():
-                    preview_images = sorted(preview_dir.glob('*.png'))
+                if inventory.is_dir(preview_dir):
+                    preview_images = inventory.files(preview_dir, ['.png'])
                     if preview_images:
                         # Use the first image as thumbnail
                         thumbnail = str(preview_images[0].relative_to(SITE_ROOT))
@@ -776,15 +1597,12 @@ def generate_archive_html():
                 remaining_images = [img for img in project_images if img not in ordered_images]
                 project_images = ordered_images + remaining_images
                 
-                # Add cache-busting for unrolled_diagram.jpg to ensure latest version
-                project_images = [f"{img}?t={int(datetime.now().timestamp())}" if 'unrolled_diagram.jpg' in img else img for img in project_images]
-                
                 logger.info(f"Final ordered images for janus_house: {project_images}")
             elif project_name == 'lego_bridge':
                 # Get all PNGs from the preview directory
                 preview_dir = project_dir / 'previews'
-                if preview_dir.exists():
-                    preview_images = sorted(preview_dir.glob('*.png'))
+                if inventory.is_dir(preview_dir):
+                    preview_images = inventory.files(preview_dir, ['.png'])
                     if preview_images:
                         # Use the first image as thumbnail
                         thumbnail = str(preview_images[0].relative_to(SITE_ROOT))
@@ -799,20 +1617,15 @@ def generate_archive_html():
                     thumbnail = project_images[0] if project_images else None
             elif project_name == 'moca_playhouse':
                 # Get all images from the main directory
-                main_images = []
-                for ext in ['.jpg', '.jpeg', '.gif', '.png', '.JPG', '.JPEG', '.GIF', '.PNG']:
-                    main_images.extend([
-                        f for f in project_dir.glob(f'*{ext}')
-                        if f.name != 'preview.png'  # Exclude old preview files
-                        and not f.stem.endswith('_presentation')  # Exclude presentation exports
-                    ])
+                main_images = [
+                    f for f in get_images_by_extension(project_dir)
+                    if f.name != 'preview.png'  # Exclude old preview files
+                    and not f.stem.endswith('_presentation')  # Exclude presentation exports
+                ]
                 
                 # Get all images from the previews directory
                 preview_dir = project_dir / 'previews'
-                preview_images = []
-                if preview_dir.exists():
-                    for ext in ['.jpg', '.jpeg', '.gif', '.png', '.JPG', '.JPEG', '.GIF', '.PNG']:
-                        preview_images.extend(preview_dir.glob(f'*{ext}'))
+                preview_images = get_images_by_extension(preview_dir)
                 
                 # Combine and sort all images
                 all_images = sorted(main_images + preview_images, key=lambda x: x.name)
@@ -864,8 +1677,8 @@ def generate_archive_html():
             elif project_name == 'rome_artist_residence':
                 # Get all PNGs from the preview directory
                 preview_dir = project_dir / 'preview'
-                if preview_dir.exists():
-                    preview_images = sorted(preview_dir.glob('*.png'))
+                if inventory.is_dir(preview_dir):
+                    preview_images = inventory.files(preview_dir, ['.png'])
                     if preview_images:
                         # Use the first image as thumbnail
                         thumbnail = str(preview_images[0].relative_to(SITE_ROOT))
@@ -881,8 +1694,8 @@ def generate_archive_html():
             elif project_name == 'renault_center':
                 # Get all PNGs from the preview directory
                 preview_dir = project_dir / 'previews'
-                if preview_dir.exists():
-                    preview_images = sorted(preview_dir.glob('*.png'))
+                if inventory.is_dir(preview_dir):
+                    preview_images = inventory.files(preview_dir, ['.png'])
                     if preview_images:
                         # Use the first image as thumbnail
                         thumbnail = str(preview_images[0].relative_to(SITE_ROOT))
@@ -898,8 +1711,8 @@ def generate_archive_html():
             elif project_name == 'remote_research_center':
                 # Get all PNGs from the preview directory
                 preview_dir = project_dir / 'previews'
-                if preview_dir.exists():
-                    preview_images = sorted(preview_dir.glob('*.png'))
+                if inventory.is_dir(preview_dir):
+                    preview_images = inventory.files(preview_dir, ['.png'])
                     if preview_images:
                         # Use the first image as thumbnail
                         thumbnail = str(preview_images[0].relative_to(SITE_ROOT))
@@ -929,42 +1742,105 @@ def generate_archive_html():
                 # Debug logging for project after sorting
                 logger.info(f"Sorted images for {project_name}: {project_images}")
             
-            # Create tag elements
-            tag_elements = []
-            for tag in project_data['tags']:
-                if 'grasshopper' in tag.lower() and 'link' in project_data:
-                    tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
-                else:
-                    tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
-            
-            item = f'''
-                <div class="project-item" data-project="{project_name}">
-                    <div class="project-header" onclick="toggleProject('{project_name}')">
-                        <div class="project-title-container">
-                            <h2 class="project-title">{project_name}</h2>
-                            <div class="project-tags">
-                                {''.join(tag_elements)}
-                            </div>
-                        </div>
-                        <div class="project-thumbnail">
-                            <img src="{thumbnail}" alt="{project_name} thumbnail">
+            project_entries.append((project_name, project_data, thumbnail, project_images))
+
+    return project_entries
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write a text file unless it already has this content, keeping its mtime (and ETag) stable.
+
+    The file is replaced atomically, so the server never sends a half-written page.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+def write_fragments(folder: Path, fragments: Dict[str, str]) -> List[Path]:
+    """Write {name: html} as folder/<name>.html, removing fragments of names that are gone."""
+    paths = []
+    for name, content in fragments.items():
+        path = folder / f"{name}.html"
+        write_if_changed(path, content)
+        paths.append(path)
+    if folder.is_dir():
+        for entry in os.scandir(folder):
+            # Precompressed siblings go with their fragment
+            name = entry.name
+            for suffix in COMPRESSION_SUFFIXES.values():
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)]
+            if name.endswith('.html') and name[:-len('.html')] not in fragments:
+                os.remove(entry.path)
+    return paths
+
+def generate_archive_html(manifest: Optional['BuildManifest'] = None) -> List[Path]:
+    """Generate the archive page and return the image derivatives and fragments it references.
+
+    Each project's images are written to fragments/archive/<project>.html and fetched when the
+    project is first expanded, so the page itself only carries headers, thumbnails and descriptions.
+    """
+    # Get all unique tags
+    all_tags = set()
+    for project_data in projects.values():
+        all_tags.update(project_data['tags'])
+    all_tags = sorted(all_tags)
+    
+    project_entries = get_project_entries(manifest)
+
+    # Create the resized derivatives for every thumbnail and project image in one batch
+    image_requests = [(thumbnail, THUMBNAIL_WIDTHS) for _, _, thumbnail, _ in project_entries]
+    image_requests += [(img, IMAGE_WIDTHS) for _, _, _, project_images in project_entries for img in project_images]
+    with build_stage('image derivatives'):
+        derivatives = create_image_derivatives(image_requests, manifest)
+
+    fragment_dir = FRAGMENTS_DIR / 'archive'
+    fragments = {}
+    project_items = []
+    for project_name, project_data, thumbnail, project_images in project_entries:
+        # Create tag elements
+        tag_elements = []
+        for tag in project_data['tags']:
+            if 'grasshopper' in tag.lower() and 'link' in project_data:
+                tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
+            else:
+                tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
+        
+        item = f'''
+            <div class="project-item" data-project="{project_name}">
+                <div class="project-header" onclick="toggleProject('{project_name}')">
+                    <div class="project-title-container">
+                        <h2 class="project-title">{project_name}</h2>
+                        <div class="project-tags">
+                            {''.join(tag_elements)}
                         </div>
-                        <button class="toggle-button">
-                            <svg width="24" height="24" viewBox="0 0 16 16">
-                                <path fill="currentColor" d="M8 4.5a.5.5 0 01.5.5v6a.5.5 0 01-1 0V5a.5.5 0 01.5-.5zM4.5 8a.5.5 0 01.5-.5h6a.5.5 0 010 1H5a.5.5 0 01-.5-.5z"/>
-                            </svg>
-                        </button>
                     </div>
-                    <div class="project-content" id="content-{project_name}">
-                        <div class="project-description">
-                            {project_data['description']}
-                        </div>
-                        <div class="project-images">
-                            {''.join(f'<img src="{img}" alt="{project_name} image" class="project-image" loading="lazy">' for img in project_images)}
-                        </div>
+                    <div class="project-thumbnail">
+                        {render_picture(thumbnail, derivatives[(thumbnail, tuple(THUMBNAIL_WIDTHS))], THUMBNAIL_SIZES, f'alt="{project_name} thumbnail"')}
+                    </div>
+                    <button class="toggle-button">
+                        <svg width="24" height="24" viewBox="0 0 16 16">
+                            <path fill="currentColor" d="M8 4.5a.5.5 0 01.5.5v6a.5.5 0 01-1 0V5a.5.5 0 01.5-.5zM4.5 8a.5.5 0 01.5-.5h6a.5.5 0 010 1H5a.5.5 0 01-.5-.5z"/>
+                        </svg>
+                    </button>
                 </div>
-            </div>'''
-            project_items.append(item)
+                <div class="project-content" id="content-{project_name}">
+                    <div class="project-description">
+                        {project_data['description']}
+                    </div>
+                    <div class="project-images" data-fragment="{(fragment_dir / f'{project_name}.html').relative_to(OUTPUT_DIR).as_posix()}"></div>
+            </div>
+        </div>'''
+        project_items.append(item)
+        fragments[project_name] = ''.join(render_picture(img, derivatives[(img, tuple(IMAGE_WIDTHS))], IMAGE_SIZES, f'data-full="{get_image_url(img, derivatives[(img, tuple(IMAGE_WIDTHS))])}" alt="{project_name} image" class="project-image" loading="lazy"') for img in project_images)
 
     html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -1445,12 +2321,40 @@ def generate_archive_html():
     
     <script>
         const projects = {projects};  // Make projects data available
-        const tools = {tools_dict};  // Make tools data available
+        const tools = {get_tools_dict()};  // Make tools data available
         
         // Initialize the set for active tags
         const activeTags = new Set();
         
-        {get_theme_toggle_js()}
+        {get_theme_toggle_js()}{get_live_reload_js()}
+        
+        // Each project's images are a prebuilt fragment, fetched once on first expand
+        const projectImageRequests = new Map();
+        
+        function loadProjectImages(projectName) {{
+            const content = document.getElementById(`content-${{projectName}}`);
+            const container = content && content.querySelector('.project-images[data-fragment]');
+            if (!container || projectImageRequests.has(projectName)) {{
+                return projectImageRequests.get(projectName) || Promise.resolve();
+            }}
+            const request = fetch(container.dataset.fragment)
+                .then(response => {{
+                    if (!response.ok) {{
+                        throw new Error(`${{response.status}} ${{response.statusText}}`);
+                    }}
+                    return response.text();
+                }})
+                .then(html => {{
+                    container.innerHTML = html;
+                }})
+                .catch(error => {{
+                    // Allow another attempt on the next expand
+                    projectImageRequests.delete(projectName);
+                    console.error(`Could not load images for ${{projectName}}:`, error);
+                }});
+            projectImageRequests.set(projectName, request);
+            return request;
+        }}
         
         function toggleProject(projectName) {{
             const content = document.getElementById(`content-${{projectName}}`);
@@ -1460,11 +2364,22 @@ def generate_archive_html():
                 content.style.display = 'none';
                 button.style.transform = 'rotate(0deg)';
             }} else {{
+                loadProjectImages(projectName);
                 content.style.display = 'block';
                 button.style.transform = 'rotate(45deg)';
             }}
         }}
         
+        // Search results link to a project by hash and expand it directly, so load its images too
+        function loadLinkedProjectImages() {{
+            const hash = window.location.hash.substring(1);
+            if (hash) {{
+                loadProjectImages(decodeURIComponent(hash));
+            }}
+        }}
+        document.addEventListener('DOMContentLoaded', loadLinkedProjectImages);
+        window.addEventListener('hashchange', loadLinkedProjectImages);
+        
         function toggleTag(tag) {{
             if (activeTags.has(tag)) {{
                 activeTags.delete(tag);
@@ -1540,24 +2455,27 @@ def generate_archive_html():
         let currentProjectImages = [];
         let currentImageIndex = 0;
         
-        // Add click handlers to all project images
-        document.querySelectorAll('.project-image').forEach(img => {{
-            img.addEventListener('click', () => {{
-                // Get all images in the current project
-                const projectItem = img.closest('.project-item');
-                currentProjectImages = Array.from(projectItem.querySelectorAll('.project-image'));
-                currentImageIndex = currentProjectImages.indexOf(img);
-                
-                modalImg.src = img.src;
-                modal.classList.add('active');
-                document.body.style.overflow = 'hidden';
-            }});
+        // Project images arrive with their fragments, so handle their clicks on the list
+        document.querySelector('.project-list').addEventListener('click', (event) => {{
+            const img = event.target.closest('.project-image');
+            if (!img) {{
+                return;
+            }}
+            // Get all images in the current project
+            const projectItem = img.closest('.project-item');
+            currentProjectImages = Array.from(projectItem.querySelectorAll('.project-image'));
+            currentImageIndex = currentProjectImages.indexOf(img);
+            
+            modalImg.src = img.dataset.full || img.currentSrc || img.src;
+            modal.classList.add('active');
+            document.body.style.overflow = 'hidden';
         }});
         
         function showImage(index) {{
             if (index >= 0 && index < currentProjectImages.length) {{
                 currentImageIndex = index;
-                modalImg.src = currentProjectImages[index].src;
+                const image = currentProjectImages[index];
+                modalImg.src = image.dataset.full || image.currentSrc || image.src;
             }}
         }}
         
@@ -1624,85 +2542,644 @@ def generate_archive_html():
     
     with open(OUTPUT_DIR / "archive.html", "w") as f:
         f.write(html)
+    fragment_paths = write_fragments(fragment_dir, fragments)
+    derivative_paths = {path for image in derivatives.values() for files in image['formats'].values() for path in files.values()}
+    return sorted(derivative_paths) + fragment_paths
 
-def generate_toolbox_html():
-    """Generate the toolbox page."""
+def get_tools() -> List[Dict]:
+    """Collect the tools in the toolbox directory, sorted by name."""
     tools = []
-    for tool_dir in TOOLBOX_DIR.iterdir():
-        if tool_dir.is_dir():
-            gh_file = next(tool_dir.glob('*.gh'), None)
-            ghx_file = next(tool_dir.glob('*.ghx'), None)
-            if ghx_file:
-                description = get_tool_description(tool_dir.name)
-                tools.append({
-                    'name': tool_dir.name,
-                    'description': description,
-                    'gh_file': gh_file,
-                    'ghx_file': ghx_file,
-                    'tags': tools_dict[tool_dir.name]['tags']  # Use tags from global dict
-                })
-        elif tool_dir.suffix == '.ghx':
-            description = get_tool_description(tool_dir.stem)
-            tools.append({
-                'name': tool_dir.stem,
-                'description': description,
-                'gh_file': None,
-                'ghx_file': tool_dir,
-                'tags': tools_dict[tool_dir.stem]['tags']  # Use tags from global dict
-            })
-    
+    for tool_name, gh_file, ghx_file in find_tool_files():
+        tools.append({
+            'name': tool_name,
+            'description': get_tool_description(tool_name),
+            'gh_file': gh_file,
+            'ghx_file': ghx_file,
+            'tags': get_tools_dict()[tool_name]['tags']  # Use tags from the tools data
+        })
+
     # Sort tools by name
     tools.sort(key=lambda x: x['name'])
+    return tools
+
+def copy_file_contents(source: Path, target: Path) -> str:
+    """Copy a file's bytes without holding them in memory, returning the method that worked.
 
+    Tries a reflink, then an in-kernel copy_file_range, then a chunked streamed copy.
+    """
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            import fcntl
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return 'reflink'
+        except (ImportError, OSError):
+            pass
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining <= 0:
+                    return 'copy_file_range'
+            except OSError:
+                pass
+            # Start over with a plain copy, e.g. across filesystems on older kernels
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+        import shutil
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+        return 'streamed'
+
+def mirror_file(source: Path, target: Path) -> str:
+    """Make target an atomic copy of source, hardlinking it when both are on one filesystem."""
+    tmp = target.with_name(f"{target.name}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        os.link(source, tmp)
+        method = 'hardlink'
+    except OSError:
+        method = copy_file_contents(source, tmp)
+    os.replace(tmp, target)
+    return method
+
+def mirror_ghx_files(manifest: 'BuildManifest', force: bool = False) -> List[Path]:
+    """Mirror each tool's GHX into ghx_content/, skipping tools whose source is unchanged.
+
+    Mirrors are hardlinks (or reflinks/kernel copies) of the toolbox originals, so no GHX is
+    decoded, re-encoded or held in memory. Returns the mirrors that were written or relinked.
+    """
     # Create a directory for the GHX content files if it doesn't exist
     ghx_content_dir = OUTPUT_DIR / 'ghx_content'
     ghx_content_dir.mkdir(exist_ok=True)
 
-    # Save GHX contents to separate files
-    for tool in tools:
-        ghx_content = read_ghx_file(tool['ghx_file'])
+    written = []
+    for tool in get_tools():
+        source = tool['ghx_file']
         content_file = ghx_content_dir / f"{tool['name']}.ghx"
-        with open(content_file, 'w', encoding='utf-8') as f:
-            f.write(ghx_content)
+        stage = f"ghx:{tool['name']}"
+        if not force and manifest.is_fresh(stage, [source]):
+            continue
+        unchanged = content_file.exists() and manifest.fingerprint(content_file) == manifest.fingerprint(source)
+        if not (unchanged and content_file.samefile(source)):
+            # An identical separate copy is still relinked, so the mirror stops taking its own disk space
+            method = mirror_file(source, content_file)
+            logger.info(f"{'Relinked' if unchanged else 'Mirrored'} {manifest_key(source)} to "
+                        f"{manifest_key(content_file)} ({method})")
+            written.append(content_file)
+        manifest.record(stage, [source], [content_file])
+        get_inventory().update(content_file)
+    return written
 
-    tool_items = []
-    for tool in tools:
-        gh_download = f'''
-            <a href="{tool['gh_file'].relative_to(SITE_ROOT)}" class="tool-button" download>
-                <svg width="16" height="16" viewBox="0 0 16 16">
-                    <path fill="currentColor" d="M7.47 10.78a.75.75 0 001.06 0l3.75-3.75a.75.75 0 00-1.06-1.06L8.75 8.44V1.75a.75.75 0 00-1.5 0v6.69L4.78 5.97a.75.75 0 00-1.06 1.06l3.75 3.75zM3.75 13a.75.75 0 000 1.5h8.5a.75.75 0 000-1.5h-8.5z"/>
-                </svg>
-                download .gh
-            </a>''' if tool['gh_file'] else ''
+def get_ghx_items(chunk: 'ET.Element', name: str) -> List['ET.Element']:
+    """Get a chunk's own items with this name."""
+    return chunk.findall(f"items/item[@name='{name}']")
 
-        # Create tag elements
-        tag_elements = []
-        for tag in tool['tags']:
-            tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
+def get_ghx_item(chunk: 'ET.Element', name: str) -> Optional[str]:
+    """Get the text of a chunk's first item with this name."""
+    items = get_ghx_items(chunk, name)
+    return (items[0].text or '') if items else None
 
-        item = f'''
-            <div class="tool-item" data-tool="{tool['name']}">
-                <div class="tool-header" onclick="toggleTool('{tool['name']}')">
-                    <div class="tool-title-container">
-                    <h2 class="tool-name">{tool['name']}</h2>
-                        <div class="tool-tags">
-                            {''.join(tag_elements)}
-                </div>
-                </div>
-                    <button class="toggle-button">
-                        <svg width="24" height="24" viewBox="0 0 16 16">
-                            <path fill="currentColor" d="M8 4.5a.5.5 0 01.5.5v6a.5.5 0 01-1 0V5a.5.5 0 01.5-.5zM4.5 8a.5.5 0 01.5-.5h6a.5.5 0 010 1H5a.5.5 0 01-.5-.5z"/>
-                        </svg>
-                    </button>
-                </div>
-                <div class="tool-content" id="content-{tool['name']}">
-                    <div class="tool-description">{tool['description'] + ('.' if not tool['description'].endswith('.') else '')}</div>
-                <div class="tool-actions">
-                        <button class="tool-button" onclick="toggleCode('{tool['name']}')">
-                        <svg width="16" height="16" viewBox="0 0 16 16">
-                            <path fill="currentColor" d="M4.72 3.22a.75.75 0 001.06 1.06L2.06 8l3.72 3.72a.75.75 0 10-1.06 1.06L.47 8.53a.75.75 0 000-1.06l4.25-4.25zm6.56 0a.75.75 0 10-1.06 1.06L13.94 8l-3.72 3.72a.75.75 0 101.06 1.06l4.25-4.25a.75.75 0 000-1.06l-4.25-4.25z"/>
-                        </svg>
+def get_ghx_bounds(chunk: 'ET.Element') -> Optional[List[float]]:
+    """Get [x, y, width, height] of a chunk's canvas Attributes, if it has any."""
+    bounds = chunk.find("chunks/chunk[@name='Attributes']/items/item[@name='Bounds']")
+    if bounds is None:
+        return None
+    return [float(bounds.findtext(axis, '0')) for axis in ('X', 'Y', 'W', 'H')]
+
+def summarize_ghx_object(obj: 'ET.Element') -> Optional[Dict]:
+    """Summarize one top-level GHX Object: identity, canvas bounds, parameters and their wire sources.
+
+    Returns None for objects that are not part of the data flow.
+    """
+    container = obj.find("chunks/chunk[@name='Container']")
+    if container is None:
+        return None
+    component = {
+        'name': get_ghx_item(container, 'Name') or get_ghx_item(obj, 'Name') or '',
+        'nickname': get_ghx_item(container, 'NickName') or '',
+        'guid': get_ghx_item(container, 'InstanceGuid'),
+        'bounds': get_ghx_bounds(container),
+        'inputs': [],
+        'outputs': [],
+        # Referenced Rhino geometry, which RefID items point at; these are not wires between components
+        'refs': sum(1 for item in obj.iter('item') if item.get('name') == 'RefID')
+    }
+    params = {'inputs': [], 'outputs': []}
+    for chunk in container.iter('chunk'):
+        kind = GHX_PARAM_CHUNKS.get(chunk.get('name'))
+        if kind:
+            params[kind].append(chunk)
+    if not params['inputs'] and not params['outputs']:
+        if get_ghx_item(container, 'SourceCount') is None:
+            return None  # Groups, scribbles and other canvas annotations
+        # A standalone parameter (slider, panel, ...) is wired to directly, so it is its own input and output
+        params = {'inputs': [container], 'outputs': [container]}
+    for kind, chunks in params.items():
+        for chunk in chunks:
+            sources = [item.text for item in get_ghx_items(chunk, 'Source') if item.text] if kind == 'inputs' else []
+            component[kind].append({'guid': get_ghx_item(chunk, 'InstanceGuid'),
+                                    'nickname': get_ghx_item(chunk, 'NickName') or get_ghx_item(chunk, 'Name') or '',
+                                    'sources': sources})
+    return component
+
+def build_ghx_index(ghx_path: str, index_path: str) -> Dict[str, int]:
+    """Stream a GHX file into a compact JSON component graph, holding one Object at a time.
+
+    Components are listed with their name, nickname, instance GUID, canvas bounds and parameter
+    nicknames; wires are [source component, output index, target component, input index].
+    """
+    import xml.etree.ElementTree as ET
+
+    components = []
+    stack = []
+    with open(ghx_path, 'rb') as f:
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+            stack.pop()
+            parent = stack[-1] if stack else None
+            # Top-level Objects sit in DefinitionObjects/chunks; cluster internals stay inside their Object
+            if (elem.tag == 'chunk' and elem.get('name') == 'Object' and len(stack) >= 2
+                    and stack[-2].get('name') == 'DefinitionObjects'):
+                component = summarize_ghx_object(elem)
+                if component:
+                    components.append(component)
+            elif any(ancestor.get('name') == 'Object' for ancestor in stack):
+                continue  # Kept until its whole Object has been summarized
+            # Drop everything already read so memory stays flat, including base64 thumbnails and icons
+            elem.clear()
+            if parent is not None:
+                parent.remove(elem)
+
+    # Resolve each Source GUID to the component output that produces it
+    producers = {}
+    for index, component in enumerate(components):
+        for output, param in enumerate(component['outputs']):
+            if param['guid']:
+                producers[param['guid']] = (index, output)
+    wires = []
+    for index, component in enumerate(components):
+        for input_index, param in enumerate(component['inputs']):
+            for source in param['sources']:
+                if source in producers:
+                    wires.append([*producers[source], index, input_index])
+
+    index = {
+        'components': [{
+            'name': component['name'],
+            'nickname': component['nickname'],
+            'guid': component['guid'],
+            'bounds': component['bounds'],
+            'inputs': [param['nickname'] for param in component['inputs']],
+            'outputs': [param['nickname'] for param in component['outputs']],
+            **({'refs': component['refs']} if component['refs'] else {})
+        } for component in components],
+        'wires': wires
+    }
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp_path, index_path)
+    return {'components': len(components), 'wires': len(wires)}
+
+def index_ghx_files(manifest: 'BuildManifest', force: bool = False) -> List[Path]:
+    """Write ghx_content/<tool>.json component graphs for every changed tool, in parallel."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    ghx_content_dir = OUTPUT_DIR / 'ghx_content'
+    ghx_content_dir.mkdir(exist_ok=True)
+    options = {'version': GHX_INDEX_VERSION}
+    pending = {}
+    for tool in get_tools():
+        stage = f"ghx-index:{tool['name']}"
+        if force or not manifest.is_fresh(stage, [tool['ghx_file']], options):
+            pending[ghx_content_dir / f"{tool['name']}.json"] = (stage, tool['ghx_file'])
+    if not pending:
+        return []
+
+    written = []
+    workers = min(len(pending), os.cpu_count() or 1)
+    logger.info(f"Indexing {len(pending)} GHX files with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(build_ghx_index, str(source), str(index_path)): index_path
+                   for index_path, (stage, source) in pending.items()}
+        for future in as_completed(futures):
+            index_path = futures[future]
+            stage, source = pending[index_path]
+            try:
+                counts = future.result()
+            except Exception as e:
+                logger.warning(f"Could not index {manifest_key(source)}: {e}")
+                continue
+            logger.info(f"Indexed {manifest_key(source)}: {counts['components']} components, {counts['wires']} wires")
+            manifest.record(stage, [source], [index_path], options)
+            get_inventory().update(index_path)
+            written.append(index_path)
+    return sorted(written)
+
+def highlight_xml(text: str, state: str = 'text') -> tuple:
+    """Highlight XML as HTML spans in one linear pass, returning (html, state at the end of text).
+
+    The state ('text', 'tag', 'comment', 'cdata' or 'value' plus its quote) carries constructs that
+    run past the end of text, such as a multi-line comment, into the next chunk. Chunks must be
+    split at line boundaries, so that no delimiter is cut in two.
+    """
+    import re
+    from html import escape
+
+    tag_token_re = re.compile(XML_TAG_TOKEN_PATTERN)
+    tag_open_re = re.compile(XML_TAG_OPEN_PATTERN)
+    out = []
+
+    def emit(kind: Optional[str], token: str):
+        if token:
+            out.append(f'<span class="ghx-{kind}">{escape(token, quote=False)}</span>' if kind else escape(token, quote=False))
+
+    pos, end = 0, len(text)
+    while pos < end:
+        if state == 'text':
+            start = text.find('<', pos)
+            if start < 0:
+                emit(None, text[pos:])
+                break
+            emit(None, text[pos:start])
+            pos = start
+            if text.startswith('<!--', pos):
+                state = 'comment'
+            elif text.startswith('<![CDATA[', pos):
+                state = 'cdata'
+            else:
+                match = tag_open_re.match(text, pos)
+                emit('tag', match.group())
+                pos = match.end()
+                state = 'tag'
+        elif state in ('comment', 'cdata'):
+            close = '-->' if state == 'comment' else ']]>'
+            stop = text.find(close, pos)
+            emit(state, text[pos:] if stop < 0 else text[pos:stop + len(close)])
+            if stop < 0:
+                break
+            pos = stop + len(close)
+            state = 'text'
+        elif state.startswith('value'):
+            stop = text.find(state[-1], pos)
+            emit('value', text[pos:] if stop < 0 else text[pos:stop + 1])
+            if stop < 0:
+                break
+            pos = stop + 1
+            state = 'tag'
+        else:
+            match = tag_token_re.match(text, pos)
+            space, name, equals, quote, close, other = match.groups()
+            if name:
+                emit('attr', name)
+            elif quote:
+                stop = text.find(quote, pos + 1)
+                emit('value', text[pos:] if stop < 0 else text[pos:stop + 1])
+                if stop < 0:
+                    state = 'value' + quote
+                    break
+                pos = stop + 1
+                continue
+            elif close:
+                emit('tag', close)
+                state = 'text'
+            else:
+                emit(None, space or equals or other)
+            pos = match.end()
+    return ''.join(out), state
+
+class HighlightCache:
+    """Content-addressed store of highlighted GHX pages with size-bounded LRU eviction.
+
+    Entries are keyed on the page bytes, the highlighter state it starts in and GHX_HIGHLIGHT_VERSION,
+    and remember the state the page ends in, so a cached page never needs tokenizing to continue.
+    """
+
+    def __init__(self, path: Path = None, max_bytes: int = None):
+        self.path = path or GHX_HIGHLIGHT_CACHE_DIR
+        self.max_bytes = GHX_HIGHLIGHT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.index_path = self.path / 'index.json'
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def key(page: bytes, state: str) -> str:
+        import hashlib
+        return hashlib.sha256(f"{GHX_HIGHLIGHT_VERSION}:{state}:".encode() + page).hexdigest()
+
+    def lookup(self, key: str) -> Optional[tuple]:
+        """Get the cached (html, end state) of a page, if present."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            with open(self.path / f"{key}.html", 'r', encoding='utf-8') as f:
+                html = f.read()
+        except OSError:
+            return None
+        entry['last_used'] = time.time()
+        return html, entry['state']
+
+    def store(self, key: str, html: str, state: str):
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / f"{key}.html", 'w', encoding='utf-8') as f:
+            f.write(html)
+        self.entries[key] = {'state': state, 'size': len(html), 'last_used': time.time()}
+
+    def evict(self):
+        """Delete least recently used pages until the cache fits in its size budget."""
+        total = sum(entry['size'] for entry in self.entries.values())
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            (self.path / f"{key}.html").unlink(missing_ok=True)
+            total -= entry['size']
+            del self.entries[key]
+
+    def save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.index_path)
+
+def preview_ghx_lines(lines: Iterable[bytes], mode: str) -> Iterator[bytes]:
+    """Stream a GHX's lines rewritten for the code viewer.
+
+    'canonical' drops the BOM, trailing whitespace and type_code attributes and re-indents every
+    tag line from its nesting depth; 'minified' does the same without any indentation. Lines of a
+    multi-line text value are kept as they are. 'original' passes the lines through unchanged.
+    """
+    import re
+
+    if mode == 'original':
+        yield from lines
+        return
+    depth_re = re.compile(XML_DEPTH_PATTERN)
+    type_code_re = re.compile(GHX_TYPE_CODE_PATTERN)
+    indent = GHX_CANONICAL_INDENT if mode == 'canonical' else b''
+    depth = 0
+    in_text = False
+    first = True
+    for line in lines:
+        if first:
+            line = line.removeprefix(b'\xef\xbb\xbf')
+            first = False
+        if in_text:
+            # A text value continues until a line ends with markup; text escapes its own '>'
+            stripped = line.rstrip(b'\r\n')
+            yield line
+        else:
+            stripped = type_code_re.sub(rb'\1', line.strip())
+            if not stripped:
+                continue
+            level = depth - 1 if stripped.startswith(b'</') else depth
+            yield indent * max(level, 0) + stripped + (b'\n' if line.endswith(b'\n') else b'')
+        for match in depth_re.finditer(stripped):
+            if match.group(1):
+                depth -= 1
+            elif not match.group(2):
+                depth += 1
+        if stripped:
+            in_text = not stripped.endswith(b'>')
+
+def paginate_ghx_file(ghx_path: Path, pages_dir: Path, cache: HighlightCache, mode: str = 'original') -> tuple:
+    """Split a GHX into highlighted, line-aligned HTML pages plus a pages.json byte-offset index.
+
+    The GHX is streamed line by line through preview_ghx_lines. The index holds the preview's
+    total size and line count, the original's size, and [byte offset, first line] per page, so
+    the viewer can size its scrollbar up front and fetch only the pages in view. Returns the files
+    written and how many pages came from the cache.
+    """
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    pages = []
+    offset = line = 0
+    buffer = []
+    buffer_bytes = 0
+    state = 'text'
+    cached = 0
+
+    def flush():
+        nonlocal offset, line, buffer, buffer_bytes, state, cached
+        page = b''.join(buffer)
+        key = cache.key(page, state)
+        hit = cache.lookup(key)
+        if hit:
+            html, state = hit
+            cached += 1
+        else:
+            html, end_state = highlight_xml(page.decode('utf-8', errors='replace').lstrip('\ufeff'), state)
+            cache.store(key, html, end_state)
+            state = end_state
+        page_path = pages_dir / f"{len(pages):04d}.html"
+        # Unchanged pages keep their mtime, and so their ETag and precompressed siblings
+        write_if_changed(page_path, html)
+        pages.append([offset, line])
+        written.append(page_path)
+        offset += buffer_bytes
+        line += len(buffer)
+        buffer = []
+        buffer_bytes = 0
+
+    with open(ghx_path, 'rb') as f:
+        for text in preview_ghx_lines(f, mode):
+            buffer.append(text)
+            buffer_bytes += len(text)
+            if buffer_bytes >= GHX_PAGE_BYTES:
+                flush()
+    if buffer or not pages:
+        flush()
+    # Pages past the new end belong to an older, longer version of the file
+    for entry in os.scandir(pages_dir):
+        number = entry.name.split('.')[0]
+        if number.isdigit() and (int(number) >= len(pages) or not entry.name.startswith(f"{number}.html")):
+            os.remove(entry.path)
+
+    index_path = pages_dir / 'pages.json'
+    write_if_changed(index_path, json.dumps({'size': offset, 'source_size': ghx_path.stat().st_size,
+                                             'lines': line, 'pages': pages}, separators=(',', ':')))
+    return written + [index_path], cached
+
+def paginate_ghx_files(manifest: 'BuildManifest', force: bool = False) -> tuple:
+    """Write ghx_content/<tool>/ highlighted pages and offset index for every tool whose GHX changed.
+
+    Returns the files written and, per GHX, the original and preview sizes in bytes.
+    """
+    options = {'page_bytes': GHX_PAGE_BYTES, 'highlight': GHX_HIGHLIGHT_VERSION, 'preview': GHX_PREVIEW_MODE}
+    cache = HighlightCache()
+    written = []
+    sizes = {}
+    for tool in get_tools():
+        stage = f"ghx-pages:{tool['name']}"
+        pages_dir = OUTPUT_DIR / 'ghx_content' / tool['name']
+        if force or not manifest.is_fresh(stage, [tool['ghx_file']], options):
+            outputs, cached = paginate_ghx_file(tool['ghx_file'], pages_dir, cache, GHX_PREVIEW_MODE)
+            manifest.record(stage, [tool['ghx_file']], outputs, options)
+            logger.info(f"Paginated {manifest_key(tool['ghx_file'])} into {len(outputs) - 1} highlighted pages "
+                        f"({cached} from cache)")
+            written.extend(outputs)
+        with open(pages_dir / 'pages.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        sizes[manifest_key(tool['ghx_file'])] = {'original_bytes': index['source_size'], 'preview_bytes': index['size']}
+    if written:
+        cache.evict()
+        cache.save()
+    return written, sizes
+
+@functools.lru_cache(maxsize=None)
+def get_compression_encodings() -> tuple:
+    """Get the content encodings that can be precompressed, Brotli first if it is installed."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        logger.info("Brotli is not installed, only writing .gz siblings")
+        return ('gzip',)
+    return ('br', 'gzip')
+
+def compress_bytes(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress data with an encoding, at its maximum level unless another is given."""
+    level = level or COMPRESSION_LEVELS[encoding]
+    if encoding == 'br':
+        import brotli
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=level)
+    import gzip
+    # A fixed mtime keeps the output identical between builds
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+def compress_file(path: str, levels: Dict[str, int]) -> List[str]:
+    """Write a compressed sibling of a file per {encoding: level} when it is smaller, returning the siblings kept."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    written = []
+    for encoding, level in levels.items():
+        sibling = path + COMPRESSION_SUFFIXES[encoding]
+        compressed = compress_bytes(data, encoding, level)
+        if len(compressed) >= len(data):
+            # Not worth serving; drop a sibling left over from an older version of the file
+            if os.path.exists(sibling):
+                os.remove(sibling)
+            continue
+        tmp_path = sibling + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, sibling)
+        written.append(sibling)
+    return written
+
+def get_compressible_outputs() -> List[Path]:
+    """Get the served text files that should have precompressed siblings."""
+    outputs = [Path(entry.path) for entry in os.scandir(OUTPUT_DIR)
+               if entry.is_file() and os.path.splitext(entry.name)[1] in COMPRESSIBLE_EXTENSIONS]
+    inventory = get_inventory()
+    for folder in (ARCHIVE_DIR, TOOLBOX_DIR):
+        outputs.extend(path for path in inventory.files(folder, COMPRESSIBLE_EXTENSIONS) if path.suffix != '.ghx')
+    # The mirrored copies, viewer pages and graph indexes; the toolbox/ originals are only downloaded
+    for root in (OUTPUT_DIR / 'ghx_content', FRAGMENTS_DIR):
+        for folder, _, files in os.walk(root):
+            outputs.extend(Path(folder) / name for name in files if os.path.splitext(name)[1] in COMPRESSIBLE_EXTENSIONS)
+    return sorted(outputs)
+
+def compress_outputs(manifest: 'BuildManifest', force: bool = False, fast: bool = False) -> List[Path]:
+    """Precompress every changed text output into .br/.gz siblings in parallel.
+
+    The levels are stage options, so a full build upgrades siblings that a fast build wrote. A fast
+    build keeps siblings of unchanged files at whatever level they have, so a watch-mode rebuild only
+    compresses the files it changed.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    levels = {encoding: (FAST_COMPRESSION_LEVELS if fast else COMPRESSION_LEVELS)[encoding]
+              for encoding in get_compression_encodings()}
+    options = {'levels': levels}
+    pending = {}
+    for path in get_compressible_outputs():
+        stage = f"compress:{manifest_key(path)}"
+        if not force and fast:
+            # Any levels will do, as long as they cover the same encodings
+            recorded = manifest.stages.get(stage, {}).get('options')
+            if recorded and recorded['levels'].keys() == levels.keys() and manifest.is_fresh(stage, [path], recorded):
+                continue
+        if force or not manifest.is_fresh(stage, [path], options):
+            pending[path] = stage
+    if not pending:
+        return []
+
+    written = []
+    workers = min(len(pending), os.cpu_count() or 1)
+    logger.info(f"Compressing {len(pending)} files with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(compress_file, str(path), levels): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                siblings = [Path(sibling) for sibling in future.result()]
+            except Exception as e:
+                logger.warning(f"Could not compress {manifest_key(path)}: {e}")
+                continue
+            manifest.record(pending[path], [path], siblings, options)
+            written.extend(siblings)
+    return sorted(written)
+
+def generate_toolbox_html():
+    """Generate the toolbox page."""
+    tools = get_tools()
+
+    tool_items = []
+    for tool in tools:
+        gh_download = f'''
+            <a href="{tool['gh_file'].relative_to(SITE_ROOT)}" class="tool-button" download>
+                <svg width="16" height="16" viewBox="0 0 16 16">
+                    <path fill="currentColor" d="M7.47 10.78a.75.75 0 001.06 0l3.75-3.75a.75.75 0 00-1.06-1.06L8.75 8.44V1.75a.75.75 0 00-1.5 0v6.69L4.78 5.97a.75.75 0 00-1.06 1.06l3.75 3.75zM3.75 13a.75.75 0 000 1.5h8.5a.75.75 0 000-1.5h-8.5z"/>
+                </svg>
+                download .gh
+            </a>''' if tool['gh_file'] else ''
+
+        # Create tag elements
+        tag_elements = []
+        for tag in tool['tags']:
+            tag_elements.append(f'<span class="tag" data-tag="{tag}">{tag}</span>')
+
+        item = f'''
+            <div class="tool-item" data-tool="{tool['name']}">
+                <div class="tool-header" onclick="toggleTool('{tool['name']}')">
+                    <div class="tool-title-container">
+                    <h2 class="tool-name">{tool['name']}</h2>
+                        <div class="tool-tags">
+                            {''.join(tag_elements)}
+                </div>
+                </div>
+                    <button class="toggle-button">
+                        <svg width="24" height="24" viewBox="0 0 16 16">
+                            <path fill="currentColor" d="M8 4.5a.5.5 0 01.5.5v6a.5.5 0 01-1 0V5a.5.5 0 01.5-.5zM4.5 8a.5.5 0 01.5-.5h6a.5.5 0 010 1H5a.5.5 0 01-.5-.5z"/>
+                        </svg>
+                    </button>
+                </div>
+                <div class="tool-content" id="content-{tool['name']}">
+                    <div class="tool-description">{tool['description'] + ('.' if not tool['description'].endswith('.') else '')}</div>
+                <div class="tool-actions">
+                        <button class="tool-button" onclick="toggleCode('{tool['name']}')">
+                        <svg width="16" height="16" viewBox="0 0 16 16">
+                            <path fill="currentColor" d="M4.72 3.22a.75.75 0 001.06 1.06L2.06 8l3.72 3.72a.75.75 0 10-1.06 1.06L.47 8.53a.75.75 0 000-1.06l4.25-4.25zm6.56 0a.75.75 0 10-1.06 1.06L13.94 8l-3.72 3.72a.75.75 0 101.06 1.06l4.25-4.25a.75.75 0 000-1.06l-4.25-4.25z"/>
+                        </svg>
                             view code
+                    </button>
+                        <button class="tool-button" onclick="toggleGraph('{tool['name']}')">
+                        <svg width="16" height="16" viewBox="0 0 16 16">
+                            <path fill="currentColor" d="M3 1.5a1.5 1.5 0 100 3 1.5 1.5 0 000-3zM0 3a3 3 0 015.9-.75h4.2a3 3 0 110 1.5H5.9A3 3 0 010 3zm13 0a1.5 1.5 0 10-3 0 1.5 1.5 0 003 0zM3 11.5a1.5 1.5 0 100 3 1.5 1.5 0 000-3zM0 13a3 3 0 015.17-2.08l4.99-5.49a.75.75 0 111.1 1.01l-4.98 5.49A3 3 0 110 13z"/>
+                        </svg>
+                            view graph
                     </button>
                     {gh_download}
                     <a href="{tool['ghx_file'].relative_to(SITE_ROOT)}" class="tool-button" download>
@@ -1713,6 +3190,7 @@ def generate_toolbox_html():
                     </a>
                 </div>
                     <pre id="code-{tool['name']}" class="code-preview"></pre>
+                    <pre id="graph-{tool['name']}" class="code-preview"></pre>
                     <div id="loading-{tool['name']}" class="loading" style="display: none;">Loading...</div>
                 </div>
             </div>'''
@@ -2102,6 +3580,7 @@ def generate_toolbox_html():
         }}
         
         {get_highlight_styles()}
+        {get_ghx_viewer_styles()}
     </style>
 </head>
 <body>
@@ -2116,12 +3595,12 @@ def generate_toolbox_html():
     
     <script>
         const projects = {projects};  // Make projects data available
-        const tools = {tools_dict};  // Make tools data available
+        const tools = {get_tools_dict()};  // Make tools data available
         
         // Initialize the set for active tags
         const activeTags = new Set();
         
-        {get_theme_toggle_js()}
+        {get_theme_toggle_js()}{get_live_reload_js()}
         
         function toggleTag(tag) {{
             if (activeTags.has(tag)) {{
@@ -2215,11 +3694,9 @@ def generate_toolbox_html():
             
             try {{
                 loadingElement.style.display = 'block';
-                const response = await fetch(`ghx_content/${{toolName}}.ghx`);
-                if (!response.ok) throw new Error(`HTTP error! status: ${{response.status}}`);
-                const content = await response.text();
-                codePreview.textContent = content;
+                // Shown first, so the viewer can measure which pages are in view
                 codePreview.style.display = 'block';
+                await openGhxViewer(codePreview, toolName);
             }} catch (error) {{
                 console.error('Error loading code:', error);
                 codePreview.textContent = 'Error loading code content.';
@@ -2229,6 +3706,48 @@ def generate_toolbox_html():
             }}
         }}
         
+        {get_ghx_viewer_js()}
+        
+        // Summarize the build's component graph index (a few KB) instead of the whole GHX
+        function formatGraph(graph) {{
+            const label = component => component.nickname && component.nickname !== component.name
+                ? `${{component.nickname}} (${{component.name}})` : component.name;
+            const incoming = graph.components.map(() => []);
+            graph.wires.forEach(([from, output, to, input]) => incoming[to].push([from, output, input]));
+            // Left to right on the canvas roughly follows the data flow
+            const position = index => graph.components[index].bounds || [Infinity, Infinity];
+            const order = graph.components.map((_, index) => index)
+                .sort((a, b) => position(a)[0] - position(b)[0] || position(a)[1] - position(b)[1]);
+            const lines = [`${{graph.components.length}} components, ${{graph.wires.length}} wires`, ''];
+            order.forEach(index => {{
+                const component = graph.components[index];
+                lines.push(label(component));
+                incoming[index].forEach(([from, output, input]) => {{
+                    const source = graph.components[from];
+                    const sourceOutput = source.outputs.length > 1 ? `.${{source.outputs[output]}}` : '';
+                    lines.push(`    ${{component.inputs[input]}} ← ${{label(source)}}${{sourceOutput}}`);
+                }});
+            }});
+            return lines.join('\\n');
+        }}
+        
+        async function toggleGraph(toolName) {{
+            const graphPreview = document.getElementById(`graph-${{toolName}}`);
+            if (graphPreview.style.display === 'block') {{
+                graphPreview.style.display = 'none';
+                return;
+            }}
+            try {{
+                const response = await fetch(`ghx_content/${{toolName}}.json`);
+                if (!response.ok) throw new Error(`HTTP error! status: ${{response.status}}`);
+                graphPreview.textContent = formatGraph(await response.json());
+            }} catch (error) {{
+                console.error('Error loading component graph:', error);
+                graphPreview.textContent = 'Error loading component graph.';
+            }}
+            graphPreview.style.display = 'block';
+        }}
+        
         function updateClock() {{
             const now = new Date();
             const options = {{ 
@@ -2286,6 +3805,322 @@ def generate_toolbox_html():
     with open(OUTPUT_DIR / "toolbox.html", "w") as f:
         f.write(html)
 
+def get_standalone_page(title: str, current_page: str, body: str, styles: str = '', script: str = '') -> str:
+    """Wrap the body of a per-project or per-tool page in the shared layout.
+
+    These pages live one folder down (archive/, toolbox/), so a <base> points every
+    relative link, image and fetch back at the site root, as on the main pages.
+    """
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="Content-Security-Policy" content="default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline';">
+    <base href="../">
+    <title>{title} - santiago martínez-oropeza</title>
+    <link rel="icon" type="image/svg+xml" href="favicon.svg">
+    <style>
+        :root {{
+            --background: {THEMES['light']['background']};
+            --text: {THEMES['light']['text']};
+            --accent: {THEMES['light']['accent']};
+            --border: {THEMES['light']['border']};
+            --hover: {THEMES['light']['hover']};
+            --card: {THEMES['light']['card']};
+        }}
+        
+        [data-theme="dark"] {{
+            --background: {THEMES['dark']['background']};
+            --text: {THEMES['dark']['text']};
+            --accent: {THEMES['dark']['accent']};
+            --border: {THEMES['dark']['border']};
+            --hover: {THEMES['dark']['hover']};
+            --card: {THEMES['dark']['card']};
+        }}
+        
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: "SF Mono", Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
+            background-color: var(--background);
+            color: var(--text);
+            min-height: 100vh;
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 2rem;
+            width: 100%;
+        }}
+        
+        .nav-container {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 2rem;
+            border-bottom: 1px solid var(--border);
+            padding-bottom: 1rem;
+        }}
+        
+        .nav-buttons, .nav-right {{
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+        }}
+        
+        .nav-button, .clock {{
+            padding: 0.75rem 1.5rem;
+            font-size: 1rem;
+            color: var(--text);
+            border: 1px solid var(--border);
+            border-radius: 4px;
+            text-decoration: none;
+            height: 3rem;
+            display: flex;
+            align-items: center;
+        }}
+        
+        .nav-button:hover, .nav-button.active {{
+            color: var(--accent);
+            border-color: var(--accent);
+        }}
+        
+        h1 {{
+            font-size: 4rem;
+            font-weight: 600;
+            margin-bottom: 1rem;
+            letter-spacing: -0.02em;
+            overflow-wrap: anywhere;
+        }}
+        
+        .page-tags {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .tag {{
+            padding: 0.25rem 0.5rem;
+            font-size: 0.8rem;
+            border: 1px solid var(--border);
+            border-radius: 4px;
+        }}
+        
+        .page-description {{
+            margin-bottom: 2rem;
+            line-height: 1.6;
+        }}
+        
+        .page-description a, .back-link {{
+            color: var(--accent);
+        }}
+        
+        .back-link {{
+            display: inline-block;
+            margin-bottom: 2rem;
+        }}
+        
+        {styles}
+        
+        @media (max-width: 768px) {{
+            .nav-container {{
+                flex-direction: column;
+                align-items: flex-start;
+                gap: 1rem;
+            }}
+            
+            h1 {{
+                font-size: 2.5rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        {get_navigation(current_page)}
+        {body}
+    </div>
+    
+    <script>
+        {get_theme_toggle_js()}{get_live_reload_js()}
+        
+        function updateClock() {{
+            const options = {{ hour: '2-digit', minute: '2-digit', second: '2-digit', timeZoneName: 'short', hour12: false }};
+            document.getElementById('clock').textContent = new Intl.DateTimeFormat(undefined, options).format(new Date()).toLowerCase();
+        }}
+        updateClock();
+        setInterval(updateClock, 1000);
+        {script}
+    </script>
+</body>
+</html>'''
+
+def render_project_page(project_name: str, project_data: Dict, project_images: List[str], derivatives: Dict) -> str:
+    """Render the standalone page of one archive project: its description and every image."""
+    tags = ''.join(f'<span class="tag">{tag}</span>' for tag in project_data['tags'])
+    attributes = f'alt="{project_name} image" class="project-image" loading="lazy"'
+    images = ''.join(
+        f'<a href="{get_image_url(img, derivatives[(img, tuple(IMAGE_WIDTHS))])}">'
+        f'{render_picture(img, derivatives[(img, tuple(IMAGE_WIDTHS))], IMAGE_SIZES, attributes)}</a>'
+        for img in project_images
+    )
+    body = f'''<a href="archive.html#{project_name}" class="back-link">← archive</a>
+        <h1>{project_name}</h1>
+        <div class="page-tags">{tags}</div>
+        <div class="page-description">{project_data['description']}</div>
+        <div class="project-images">{images}</div>'''
+    styles = '''.project-images {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+            gap: 1rem;
+        }
+        
+        .project-image {
+            width: 100%;
+            height: auto;
+            border: 1px solid var(--border);
+        }'''
+    return get_standalone_page(project_name, 'archive', body, styles)
+
+def render_tool_page(tool: Dict) -> str:
+    """Render the standalone page of one toolbox tool: its description, downloads and code."""
+    tags = ''.join(f'<span class="tag">{tag}</span>' for tag in tool['tags'])
+    downloads = ''.join(
+        f'<a href="{path.relative_to(SITE_ROOT).as_posix()}" class="tool-button" download>download {path.suffix}</a>'
+        for path in (tool['gh_file'], tool['ghx_file']) if path
+    )
+    body = f'''<a href="toolbox.html#{tool['name']}" class="back-link">← toolbox</a>
+        <h1>{tool['name']}</h1>
+        <div class="page-tags">{tags}</div>
+        <div class="page-description">{tool['description'] + ('.' if not tool['description'].endswith('.') else '')}</div>
+        <div class="tool-actions">
+            <button class="tool-button" id="viewCode" onclick="toggleCode()">view code</button>
+            {downloads}
+        </div>
+        <pre id="code" class="code-preview"></pre>'''
+    styles = '''.tool-actions {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 1rem;
+        }
+        
+        .tool-button {
+            padding: 0.5rem 1rem;
+            font-family: inherit;
+            font-size: 0.9rem;
+            color: var(--text);
+            background: transparent;
+            border: 1px solid var(--border);
+            border-radius: 4px;
+            cursor: pointer;
+            text-decoration: none;
+        }
+        
+        .tool-button:hover {
+            color: var(--accent);
+            border-color: var(--accent);
+        }
+        
+        .code-preview {
+            display: none;
+            margin-top: 1rem;
+            padding: 1rem;
+            border: 1px solid var(--border);
+            border-radius: 4px;
+            font-family: inherit;
+            font-size: 0.9rem;
+            white-space: pre;
+            overflow: auto;
+            max-height: 70vh;
+        }''' + get_ghx_viewer_styles()
+    script = get_ghx_viewer_js() + f'''
+        // The code is only fetched when asked for, and then only the pages in view
+        function toggleCode() {{
+            const code = document.getElementById('code');
+            const button = document.getElementById('viewCode');
+            if (code.style.display === 'block') {{
+                code.style.display = 'none';
+                button.textContent = 'view code';
+                return;
+            }}
+            code.style.display = 'block';
+            button.textContent = 'close';
+            openGhxViewer(code, '{tool['name']}').catch(error => {{
+                console.error('Error loading code:', error);
+                code.textContent = 'Error loading code content.';
+            }});
+        }}'''
+    return get_standalone_page(tool['name'], 'toolbox', body, styles, script)
+
+def get_tool_inputs(tool: Dict) -> List[Path]:
+    """Get the files one tool's page depends on: its definitions and readme."""
+    readme = TOOLBOX_DIR / f"{tool['name']}_readme.txt"
+    return [path for path in (tool['gh_file'], tool['ghx_file']) if path] + ([readme] if get_inventory().exists(readme) else [])
+
+def generate_standalone_pages(manifest: 'BuildManifest', force: bool = False,
+                              options: Optional[Dict] = None) -> List[Path]:
+    """Write archive/<project>.html and toolbox/<tool>.html for every project and tool whose inputs changed.
+
+    Each page is its own incremental stage; pages that render to the same HTML are left untouched.
+    Project images are only discovered when a project page is stale, reusing the archive stage's scan.
+    """
+    inventory = get_inventory()
+    project_options = get_image_options(options)
+    stale_projects = []
+    stale_names = {}
+    for project_name in projects:
+        project_dir = ARCHIVE_DIR / project_name
+        if not inventory.is_dir(project_dir):
+            continue
+        page = ARCHIVE_DIR / f"{project_name}.html"
+        inputs = [GENERATOR_PATH] + inventory.walk_files(project_dir)
+        if force or not manifest.is_fresh(f"page:{manifest_key(page)}", inputs, project_options):
+            stale_names[project_name] = (page, inputs)
+    if stale_names:
+        entries = {entry[0]: entry for entry in get_project_entries(manifest)}
+        for project_name, (page, inputs) in stale_names.items():
+            if project_name not in entries:
+                # A folder without images gets no page; recording that keeps it from rescanning every build
+                manifest.record(f"page:{manifest_key(page)}", inputs, [], project_options)
+                continue
+            _, project_data, _, project_images = entries[project_name]
+            stale_projects.append((page, inputs, project_name, project_data, project_images))
+    # The archive stage has already encoded these images, so this only looks up cached derivatives
+    requests = [(img, IMAGE_WIDTHS) for *_, project_images in stale_projects for img in project_images]
+    derivatives = create_image_derivatives(requests, manifest) if requests else {}
+
+    # (page, inputs, extra outputs, stage options, render, render arguments)
+    jobs = []
+    for page, inputs, project_name, project_data, project_images in stale_projects:
+        files = [path for img in project_images
+                 for formats in derivatives[(img, tuple(IMAGE_WIDTHS))]['formats'].values() for path in formats.values()]
+        jobs.append((page, inputs, files, project_options, render_project_page,
+                     (project_name, project_data, project_images, derivatives)))
+    for tool in get_tools():
+        page = TOOLBOX_DIR / f"{tool['name']}.html"
+        inputs = [GENERATOR_PATH] + get_tool_inputs(tool)
+        if force or not manifest.is_fresh(f"page:{manifest_key(page)}", inputs, options):
+            jobs.append((page, inputs, [], options, render_tool_page, (tool,)))
+    if not jobs:
+        return []
+
+    # Rendering is pure Python string work, so it runs in this thread; a pool would only overlap the writes
+    logger.info(f"Rendering {len(jobs)} project and tool pages")
+    written = []
+    for page, inputs, files, page_options, render, args in jobs:
+        if write_if_changed(page, render(*args)):
+            written.append(page)
+        manifest.record(f"page:{manifest_key(page)}", inputs, [page] + files, page_options)
+        inventory.update(page)
+    return sorted(written)
+
 def get_theme_toggle_js():
     """Generate the JavaScript code for the theme toggle functionality."""
     return '''
@@ -2318,47 +4153,971 @@ def get_theme_toggle_js():
     }
     '''
 
-def main():
-    """Main function to generate the site."""
+def get_live_reload_js():
+    """Generate the live reload client for dev builds; empty otherwise."""
+    if not LIVE_RELOAD:
+        return ''
+    return f'''
+    // Live reload: reload this page when it was rebuilt, otherwise swap changed images and stylesheets
+    (function() {{
+        const page = decodeURIComponent(location.pathname.slice(1)) || 'index.html';
+        const source = new EventSource('{LIVE_RELOAD_PATH}');
+        source.addEventListener('rebuilt', function(event) {{
+            const change = JSON.parse(event.data);
+            if (change.pages.includes(page)) {{
+                location.reload();
+                return;
+            }}
+            const stamp = 'livereload=' + Date.now();
+            const isChanged = url => {{
+                const path = decodeURIComponent(new URL(url, location.href).pathname.slice(1));
+                return change.assets.some(asset => path.startsWith(asset));
+            }};
+            const refresh = url => isChanged(url) ? url.split('?')[0] + '?' + stamp : url;
+            document.querySelectorAll('link[rel="stylesheet"]').forEach(link => {{
+                link.setAttribute('href', refresh(link.getAttribute('href')));
+            }});
+            document.querySelectorAll('img, source').forEach(element => {{
+                ['src', 'data-full'].forEach(attribute => {{
+                    if (element.hasAttribute(attribute)) {{
+                        element.setAttribute(attribute, refresh(element.getAttribute(attribute)));
+                    }}
+                }});
+                if (element.hasAttribute('srcset')) {{
+                    element.setAttribute('srcset', element.getAttribute('srcset').split(',').map(candidate => {{
+                        const [url, descriptor] = candidate.trim().split(/\\s+/);
+                        return refresh(url) + (descriptor ? ' ' + descriptor : '');
+                    }}).join(', '));
+                }}
+            }});
+        }});
+    }})();
+    '''
+
+def manifest_key(path: Path) -> str:
+    """Return the key used for a path in the build manifest."""
     try:
-        # Generate all pages
-        generate_index_html()
-        logger.info("Generated index.html")
-        
-        generate_archive_html()
-        logger.info("Generated archive.html")
-        
-        generate_toolbox_html()
-        logger.info("Generated toolbox.html")
-        
-        # Start HTTP server
-        import http.server
-        import socketserver
-        import socket
+        return path.relative_to(SITE_ROOT).as_posix()
+    except ValueError:
+        return str(path)
 
-        class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-            def end_headers(self):
-                # Add CSP header
-                self.send_header('Content-Security-Policy', "default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval'; style-src 'self' 'unsafe-inline';")
-                super().end_headers()
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in chunks."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-        def find_available_port(start_port=8000, max_attempts=10):
-            for port in range(start_port, start_port + max_attempts):
+class BuildManifest:
+    """Persistent record of input fingerprints and the outputs each build stage produced."""
+
+    def __init__(self, path: Path = None):
+        self.path = path or BUILD_MANIFEST_PATH
+        self.files: Dict[str, Dict] = {}
+        self.stages: Dict[str, Dict] = {}
+        # Stages this build checked or ran; the rest belong to removed inputs or old options
+        self.used: set = set()
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk, starting empty if it is missing or outdated."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != MANIFEST_VERSION:
+            logger.info("Build manifest format changed, rebuilding everything")
+            return
+        self.files = data.get('files', {})
+        self.stages = data.get('stages', {})
+
+    def save(self):
+        """Write the manifest atomically if anything changed."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files, 'stages': self.stages}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def fingerprint(self, path: Path, stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """Get the content hash of a file, only rehashing it when its size or mtime changed.
+
+        A stat result already known from the inventory can be passed to avoid another stat call.
+        """
+        key = manifest_key(path)
+        try:
+            stat = stat or path.stat()
+        except FileNotFoundError:
+            if self.files.pop(key, None) is not None:
+                self.dirty = True
+            return None
+        entry = self.files.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+        digest = hash_file(path)
+        self.files[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+        self.dirty = True
+        return digest
+
+    def is_fresh(self, stage: str, inputs: List[Path], options: Optional[Dict] = None) -> bool:
+        """Check whether a stage's inputs, options and recorded outputs are unchanged since it last ran."""
+        self.used.add(stage)
+        record = self.stages.get(stage)
+        if record is None or record.get('options') != options:
+            return False
+        inventory = get_inventory()
+        if {manifest_key(p): self.fingerprint(p, inventory.stat(p)) for p in inputs} != record['inputs']:
+            return False
+        return all(self.fingerprint(SITE_ROOT / output, inventory.stat(SITE_ROOT / output)) == digest
+                   for output, digest in record['outputs'].items())
+
+    def record(self, stage: str, inputs: List[Path], outputs: List[Path], options: Optional[Dict] = None):
+        """Remember the inputs a stage consumed, the options it ran with and the outputs it produced."""
+        self.used.add(stage)
+        self.stages[stage] = {
+            'inputs': {manifest_key(p): self.fingerprint(p) for p in inputs},
+            'outputs': {manifest_key(p): self.fingerprint(p) for p in outputs}
+        }
+        if options is not None:
+            self.stages[stage]['options'] = options
+        self.dirty = True
+
+    def prune(self):
+        """Drop the stages this build neither checked nor ran, and the fingerprints only they referenced."""
+        stale = set(self.stages) - self.used
+        for stage in stale:
+            del self.stages[stage]
+        referenced = {key for record in self.stages.values() for files in (record['inputs'], record['outputs'])
+                      for key in files}
+        stale_files = set(self.files) - referenced
+        for key in stale_files:
+            del self.files[key]
+        if stale or stale_files:
+            logger.info(f"Pruned {len(stale)} stages and {len(stale_files)} fingerprints from the build manifest")
+            self.dirty = True
+
+def get_toolbox_inputs() -> List[Path]:
+    """Get the toolbox files that tool discovery and descriptions depend on."""
+    return [path for path in get_inventory().walk_files(TOOLBOX_DIR) if path.suffix in ('.gh', '.ghx', '.txt')]
+
+def get_archive_inputs() -> List[Path]:
+    """Get every file in the archive folders of the listed projects."""
+    inputs = []
+    for project_name in projects:
+        inputs.extend(get_inventory().walk_files(ARCHIVE_DIR / project_name))
+    return inputs
+
+def get_resource_usage() -> Dict[str, float]:
+    """Snapshot wall time, CPU time, bytes read/written and peak RSS of the build.
+
+    CPU time, block I/O and peak RSS include worker processes once they have exited.
+    """
+    times = os.times()
+    usage = {
+        'wall': time.perf_counter(),
+        'cpu': times.user + times.system + times.children_user + times.children_system,
+        'read': 0,
+        'written': 0,
+        'peak_rss': 0
+    }
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        resource = None
+    try:
+        with open('/proc/self/io', 'r') as f:
+            counters = dict(line.split(': ') for line in f.read().splitlines())
+        usage['read'] = int(counters['rchar'])
+        usage['written'] = int(counters['wchar'])
+    except (OSError, KeyError, ValueError):
+        if resource is not None:
+            own = resource.getrusage(resource.RUSAGE_SELF)
+            usage['read'] = own.ru_inblock * 512
+            usage['written'] = own.ru_oublock * 512
+    if resource is not None:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        # Worker processes only report block I/O
+        usage['read'] += children.ru_inblock * 512
+        usage['written'] += children.ru_oublock * 512
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        scale = 1 if sys.platform == 'darwin' else 1024
+        usage['peak_rss'] = max(own.ru_maxrss, children.ru_maxrss) * scale
+    return usage
+
+def measure_usage(before: Dict[str, float], after: Dict[str, float]) -> Dict[str, float]:
+    """Turn two resource snapshots into the figures reported for a stage."""
+    return {
+        'wall_seconds': round(after['wall'] - before['wall'], 6),
+        'cpu_seconds': round(after['cpu'] - before['cpu'], 6),
+        'bytes_read': after['read'] - before['read'],
+        'bytes_written': after['written'] - before['written'],
+        'peak_rss_bytes': after['peak_rss']
+    }
+
+class BuildReport:
+    """Wall time, CPU time, I/O and peak memory of each build stage."""
+
+    def __init__(self, force: bool = False):
+        from datetime import datetime
+        self.started = datetime.now()
+        self.force = force
+        self.stages: List[Dict] = []
+        self.depth = 0
+        self.start_usage = get_resource_usage()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure a stage; stages opened inside it are recorded as its children."""
+        record = {'name': name, 'depth': self.depth, 'status': 'ran'}
+        self.stages.append(record)
+        self.depth += 1
+        before = get_resource_usage()
+        try:
+            yield record
+        finally:
+            self.depth -= 1
+            record.update(measure_usage(before, get_resource_usage()))
+
+    def to_dict(self) -> Dict:
+        return {
+            'started': self.started.isoformat(timespec='seconds'),
+            'force': self.force,
+            'total': measure_usage(self.start_usage, get_resource_usage()),
+            'stages': self.stages
+        }
+
+    def write(self, path: Path = None) -> Dict:
+        """Write the report as JSON and return it."""
+        path = path or BUILD_REPORT_PATH
+        data = self.to_dict()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return data
+
+    def summary(self, data: Dict) -> str:
+        """Format a report as a table for the log."""
+        rows = [('stage', 'status', 'wall ms', 'cpu ms', 'read KB', 'written KB', 'peak RSS MB')]
+        for record in data['stages'] + [dict(data['total'], name='total', depth=0, status='')]:
+            rows.append((
+                '  ' * record['depth'] + record['name'],
+                record['status'],
+                f"{record['wall_seconds'] * 1000:.1f}",
+                f"{record['cpu_seconds'] * 1000:.1f}",
+                f"{record['bytes_read'] / 1024:.0f}",
+                f"{record['bytes_written'] / 1024:.0f}",
+                f"{record['peak_rss_bytes'] / 1024 / 1024:.1f}"
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return '\n'.join(
+            '  '.join(cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+            for row in rows
+        )
+
+_active_report: Optional[BuildReport] = None
+
+@contextmanager
+def build_stage(name: str):
+    """Measure a stage of the running build; does nothing outside build_site()."""
+    if _active_report is None:
+        yield {}
+        return
+    with _active_report.stage(name) as record:
+        yield record
+
+def run_stage(manifest: BuildManifest, stage: str, generate: Callable[[], Optional[List[Path]]],
+              inputs: List[Path], outputs: List[Path], force: bool = False, options: Optional[Dict] = None) -> bool:
+    """Run a generator unless its inputs, options and outputs are unchanged since the last build.
+
+    A generator may return extra output files (such as image derivatives) to track alongside its page.
+    """
+    with build_stage(stage) as record:
+        if not force and manifest.is_fresh(stage, inputs, options):
+            logger.info(f"Skipping {stage}: inputs unchanged")
+            record['status'] = 'skipped'
+            return False
+        extra_outputs = generate() or []
+        manifest.record(stage, inputs, outputs + extra_outputs, options)
+        record['outputs'] = [manifest_key(p) for p in outputs]
+        logger.info(f"Generated {', '.join(record['outputs'])}")
+        return True
+
+def build_site(force: bool = False, fast_compression: bool = False) -> Dict:
+    """Generate every page, skipping stages whose inputs have not changed.
+
+    Writes a build report with per-stage timings to .build/report.json and returns it.
+    """
+    global _active_report
+    report = _active_report = BuildReport(force)
+    manifest = BuildManifest()
+    try:
+        with build_stage('filesystem scan'):
+            # Rescan the content directories once; every stage below queries this inventory
+            reset_inventory()
+            get_inventory()
+            toolbox_inputs = get_toolbox_inputs()
+            archive_inputs = get_archive_inputs()
+        # Pages built with the live reload client must be rebuilt without it, and vice versa
+        page_options = {'live_reload': True} if LIVE_RELOAD else None
+        run_stage(manifest, 'index', generate_index_html,
+                  [GENERATOR_PATH] + toolbox_inputs, [OUTPUT_DIR / 'index.html'], force, page_options)
+        run_stage(manifest, 'archive', lambda: generate_archive_html(manifest),
+                  [GENERATOR_PATH] + toolbox_inputs + archive_inputs, [OUTPUT_DIR / 'archive.html'], force,
+                  get_image_options(page_options))
+        run_stage(manifest, 'toolbox', generate_toolbox_html,
+                  [GENERATOR_PATH] + toolbox_inputs, [OUTPUT_DIR / 'toolbox.html'], force, page_options)
+        with build_stage('project and tool pages') as record:
+            pages = generate_standalone_pages(manifest, force, page_options)
+            record['status'] = 'ran' if pages else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in pages]
+        if pages:
+            logger.info(f"Generated {len(pages)} project and tool pages")
+        with build_stage('ghx mirroring') as record:
+            mirrored = mirror_ghx_files(manifest, force)
+            record['status'] = 'ran' if mirrored else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in mirrored]
+        if mirrored:
+            logger.info(f"Mirrored or relinked {len(mirrored)} GHX files")
+        with build_stage('ghx pagination') as record:
+            paginated, preview_sizes = paginate_ghx_files(manifest, force)
+            record['status'] = 'ran' if paginated else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in paginated]
+            record['preview_mode'] = GHX_PREVIEW_MODE
+            record['preview_sizes'] = preview_sizes
+        if GHX_PREVIEW_MODE != 'original':
+            for key, sizes in preview_sizes.items():
+                saved = sizes['original_bytes'] - sizes['preview_bytes']
+                logger.info(f"{GHX_PREVIEW_MODE.capitalize()} preview of {key}: {sizes['preview_bytes'] / 1024:.0f} KB, "
+                            f"{saved / 1024:.0f} KB ({saved / max(sizes['original_bytes'], 1):.0%}) smaller")
+        with build_stage('ghx graph index') as record:
+            indexed = index_ghx_files(manifest, force)
+            record['status'] = 'ran' if indexed else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in indexed]
+        with build_stage('precompression') as record:
+            compressed = compress_outputs(manifest, force, fast_compression)
+            record['status'] = 'ran' if compressed else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in compressed]
+        if compressed:
+            logger.info(f"Wrote {len(compressed)} precompressed siblings")
+        # Only a complete build knows every stage, and so every derivative, that is still current
+        manifest.prune()
+        with build_stage('derivative cleanup') as record:
+            removed = prune_derivatives(manifest)
+            record['status'] = 'ran' if removed else 'skipped'
+            record['outputs'] = [manifest_key(p) for p in removed]
+    finally:
+        manifest.save()
+        _active_report = None
+    data = report.write()
+    logger.info(f"Build report written to {manifest_key(BUILD_REPORT_PATH)}\n{report.summary(data)}")
+    return data
+
+def get_pdf_stems(folder: str) -> set:
+    """Get the stems of the PDFs in a folder, whose pages the build rasterizes into its previews/."""
+    try:
+        return {name[:-len('.pdf')] for name in os.listdir(folder) if name.endswith('.pdf')}
+    except OSError:
+        return set()
+
+def is_rendered_pdf_page(name: str, pdf_stems: set) -> bool:
+    """Check whether a file in previews/ is a page image the build rendered from one of these PDFs."""
+    stem, ext = os.path.splitext(name)
+    pdf_stem, _, page = stem.rpartition('_')
+    return ext == '.png' and page.isdigit() and pdf_stem in pdf_stems
+
+def snapshot_watched_files() -> Dict[str, tuple]:
+    """Get (mtime_ns, size) of the generator, the top-level CSS/JS and every file under archive/ and toolbox/."""
+    snapshot = {}
+    stack = [str(ARCHIVE_DIR), str(TOOLBOX_DIR)]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        pdf_stems = get_pdf_stems(os.path.dirname(folder)) if os.path.basename(folder) == 'previews' else set()
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not (entry.name.endswith(WATCH_IGNORED_SUFFIXES) or is_rendered_pdf_page(entry.name, pdf_stems)):
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue  # Deleted while scanning; the next poll settles it
+    for entry in os.scandir(OUTPUT_DIR):
+        if entry.name.endswith(WATCH_ASSET_EXTENSIONS) and entry.is_file():
+            stat = entry.stat()
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    stat = GENERATOR_PATH.stat()
+    snapshot[str(GENERATOR_PATH)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def watch_and_rebuild(build_argv: List[str], interval: float = WATCH_INTERVAL, debounce: float = WATCH_DEBOUNCE,
+                      on_rebuild: Optional[Callable[[List[str], List[str]], None]] = None):
+    """Poll the build inputs and rebuild after each burst of changes settles, forever.
+
+    Each rebuild runs the generator in a fresh process, so edits to this script (such as the
+    projects dict) take effect and a half-saved script cannot take the server down. The build
+    manifest limits the work to the pages whose inputs changed. on_rebuild gets the pages whose
+    content changed and the changed input files.
+    """
+    import subprocess
+
+    previous = snapshot_watched_files()
+    while True:
+        time.sleep(interval)
+        current = snapshot_watched_files()
+        if current == previous:
+            continue
+        # Editors and file copies write in bursts; wait until a poll sees no further change
+        while True:
+            time.sleep(debounce)
+            settled = snapshot_watched_files()
+            if settled == current:
+                break
+            current = settled
+        changed = sorted(path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path))
+        previous = current
+        names = ', '.join(manifest_key(Path(path)) for path in changed[:3]) + (', ...' if len(changed) > 3 else '')
+        logger.info(f"Changed: {names}; rebuilding")
+
+        page_digests = get_page_digests()
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, str(GENERATOR_PATH), '--no-serve'] + build_argv)
+        elapsed = (time.perf_counter() - started) * 1000
+        if result.returncode != 0:
+            logger.error(f"Rebuild failed after {elapsed:.0f} ms; fix the error and save again")
+            continue
+        try:
+            with open(BUILD_REPORT_PATH, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            report = {'stages': []}
+        rebuilt = [output for stage in report['stages']
+                   if stage['status'] == 'ran' and stage['name'] in ('index', 'archive', 'toolbox', 'project and tool pages')
+                   for output in stage.get('outputs', [])]
+        logger.info(f"Rebuilt {', '.join(rebuilt) or 'nothing'} in {elapsed:.0f} ms")
+        if on_rebuild:
+            # A page whose stage ran can still come out identical, e.g. when only an image changed
+            new_digests = get_page_digests()
+            pages = [page for page in rebuilt if new_digests.get(page) != page_digests.get(page)]
+            # The archive page loads each project's images from a fragment, so a changed fragment reloads it
+            fragment_prefix = manifest_key(FRAGMENTS_DIR / 'archive') + '/'
+            if 'archive.html' not in pages and any(key.startswith(fragment_prefix) and new_digests.get(key) != page_digests.get(key)
+                                                   for key in new_digests.keys() | page_digests.keys()):
+                pages.append('archive.html')
+            on_rebuild(pages, [manifest_key(Path(path)) for path in changed])
+
+def get_page_digests() -> Dict[str, str]:
+    """Hash the generated pages and archive fragments, to tell which ones a rebuild actually changed."""
+    digests = {}
+    pages = [OUTPUT_DIR / page for page in ('index.html', 'archive.html', 'toolbox.html')]
+    for folder in (ARCHIVE_DIR, TOOLBOX_DIR, FRAGMENTS_DIR / 'archive'):
+        if folder.is_dir():
+            pages.extend(Path(entry.path) for entry in os.scandir(folder) if entry.name.endswith('.html'))
+    for page in pages:
+        try:
+            digests[manifest_key(page)] = hash_file(page)
+        except OSError:
+            continue
+    return digests
+
+def get_live_reload_event(pages: List[str], changed: List[str]) -> Dict:
+    """Describe a rebuild for live reload clients: pages to reload and asset path prefixes to refetch.
+
+    A changed source image is also matched by the prefix of its derivatives.
+    """
+    assets = []
+    for key in changed:
+        path = SITE_ROOT / key
+        if path.suffix.lower() in IMAGE_EXTENSIONS:
+            assets.append(key)
+            assets.append(manifest_key(derivative_prefix(path)))
+        elif path.suffix in WATCH_ASSET_EXTENSIONS:
+            assets.append(key)
+    return {'pages': pages, 'assets': assets}
+
+class LiveReloadChannel:
+    """The latest rebuild event, handed to every live reload stream waiting for it."""
+
+    def __init__(self):
+        import threading
+        self.condition = threading.Condition()
+        self.version = 0
+        self.data = ''
+        self.closed = False
+
+    def publish(self, event: Dict):
+        with self.condition:
+            self.version += 1
+            self.data = json.dumps(event)
+            self.condition.notify_all()
+
+    def close(self):
+        """Wake every waiting stream and make them end, as the server is shutting down."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> Optional[tuple]:
+        """Wait for an event newer than version seen; returns (version, data), or None on timeout or close."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.version != seen or self.closed, timeout) or self.closed:
+                return None
+            return self.version, self.data
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """Pick the content coding to send from an Accept-Encoding header, or None for identity.
+
+    Codings with equal weight are chosen in the order of available, which lists the smallest first.
+    """
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
                 try:
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.bind(('', port))
-                        return port
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights['gzip' if name == 'x-gzip' else name] = weight
+    best = None
+    for encoding in available:
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > 0 and (best is None or weight > best[0]):
+            best = (weight, encoding)
+    return best[1] if best else None
+
+class CompressedResponseCache:
+    """In-memory LRU of files the dev server compressed on the fly, keyed by path, mtime and coding.
+
+    Shared by the server's worker threads; compression itself runs outside the lock, at the fast
+    levels, since a response waits on it. The build's precompressed siblings use the maximum levels.
+    """
+
+    def __init__(self, max_bytes: int = COMPRESSED_RESPONSE_CACHE_BYTES):
+        import threading
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: Dict[tuple, bytes] = {}
+        self.lock = threading.Lock()
+
+    def get(self, path: str, stat: os.stat_result, encoding: str) -> bytes:
+        """Get a file compressed with an encoding, compressing it on a miss."""
+        key = (path, stat.st_mtime_ns, stat.st_size, encoding)
+        with self.lock:
+            data = self.entries.pop(key, None)
+            if data is not None:
+                # Reinsert so the dict stays in least recently used order
+                self.entries[key] = data
+                return data
+        with open(path, 'rb') as f:
+            data = compress_bytes(f.read(), encoding, FAST_COMPRESSION_LEVELS[encoding])
+        with self.lock:
+            # Another thread may have compressed the same file meanwhile
+            self.size -= len(self.entries.pop(key, b''))
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self.entries) > 1:
+                oldest = next(iter(self.entries))
+                self.size -= len(self.entries.pop(oldest))
+        return data
+
+def make_etag(stat: os.stat_result, encoding: Optional[str] = None) -> str:
+    """Build a strong ETag from a file's mtime and size; each content coding is a separate representation."""
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    return f'"{etag}-{encoding}"' if encoding else f'"{etag}"'
+
+def is_not_modified(headers, etag: str, mtime: float) -> bool:
+    """Check a request's If-None-Match or, failing that, If-Modified-Since against a file."""
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match is not None:
+        # If-None-Match uses weak comparison, so W/ prefixes are ignored
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+    if_modified_since = headers.get('If-Modified-Since')
+    if if_modified_since:
+        from datetime import timezone
+        from email.utils import parsedate_to_datetime
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # Last-Modified has one-second resolution
+        return int(mtime) <= since.timestamp()
+    return False
+
+def parse_byte_ranges(header: str, length: int) -> Optional[List[tuple]]:
+    """Parse a Range header into sorted, merged, inclusive (start, end) byte ranges.
+
+    Returns None when the header is malformed or not in bytes, so the whole file is sent,
+    and an empty list when none of the ranges can be satisfied.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+    ranges = []
+    parsed = 0
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition('-')
+        first, last = first.strip(), last.strip()
+        if not dash or not (first.isdigit() or last.isdigit()) or (first and not first.isdigit()) \
+                or (last and not last.isdigit()) or (first and last and int(last) < int(first)):
+            return None
+        parsed += 1
+        if not first:
+            # Suffix range: the last N bytes
+            if int(last) > 0 and length > 0:
+                ranges.append((max(0, length - int(last)), length - 1))
+        elif int(first) < length:
+            ranges.append((int(first), min(int(last), length - 1) if last else length - 1))
+    if not parsed:
+        return None
+    # Overlapping or adjacent ranges are sent once
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def if_range_matches(if_range: str, etag: str, last_modified: str) -> bool:
+    """Check an If-Range validator; a mismatch means the client's partial copy is stale."""
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith('W/'):
+        # If-Range uses strong comparison, which a weak tag never passes
+        return if_range == etag
+    return if_range == last_modified
+
+def get_cache_control(content_type: str, query: str = '') -> str:
+    """Get the dev server's Cache-Control policy for a content type and request query.
+
+    Versioned asset URLs (?v=<content hash>) change whenever their content does, so they never need revalidating.
+    """
+    from urllib.parse import parse_qs
+    if 'v' in parse_qs(query):
+        return IMMUTABLE_CACHE_CONTROL
+    return next((policy for prefix, policy in CACHE_CONTROL_POLICIES if content_type.startswith(prefix)), 'no-cache')
+
+def is_compressible(path: str, content_type: str) -> bool:
+    """Check whether a served file is text that benefits from compression."""
+    return (os.path.splitext(path)[1] in COMPRESSIBLE_EXTENSIONS or content_type.startswith('text/')
+            or content_type in ('application/javascript', 'application/json', 'application/xml', 'image/svg+xml'))
+
+def serve_site(port: int = 8000, bind: str = '', workers: int = 16, backlog: int = 128,
+               keep_alive_timeout: float = 5.0, live_reload: Optional[LiveReloadChannel] = None):
+    """Serve the site over HTTP/1.1 with persistent connections, processing at most `workers` requests at once.
+
+    Each connection gets a daemon thread, but only one that is processing a request holds a worker
+    slot, so idle keep-alive connections never delay other requests. With a live reload channel,
+    rebuild events are streamed to pages as Server-Sent Events.
+    """
+    import io
+    import http.server
+    import socket
+    import threading
+
+    compressed_cache = CompressedResponseCache()
+    request_slots = threading.BoundedSemaphore(workers)
+
+    class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+        # Keep connections open between requests; idle ones are closed after the timeout to free their thread
+        protocol_version = 'HTTP/1.1'
+        timeout = keep_alive_timeout
+        holding_slot = False
+        # GHX definitions are XML; serve them as such so they are compressed like other text
+        extensions_map = {**http.server.SimpleHTTPRequestHandler.extensions_map, '.ghx': 'application/xml'}
+
+        def parse_request(self):
+            # The request line has arrived, so the connection is no longer idle: wait for a worker slot
+            request_slots.acquire()
+            self.holding_slot = True
+            return super().parse_request()
+
+        def handle_one_request(self):
+            try:
+                super().handle_one_request()
+            finally:
+                self.release_slot()
+
+        def release_slot(self):
+            if self.holding_slot:
+                self.holding_slot = False
+                request_slots.release()
+
+        def do_GET(self):
+            if live_reload is not None and self.path.split('?', 1)[0] == LIVE_RELOAD_PATH:
+                self.stream_live_reload()
+            else:
+                super().do_GET()
+
+        def stream_live_reload(self):
+            """Push each rebuild event to the page until it goes away or the server shuts down.
+
+            Open pages hold a thread but no worker slot.
+            """
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.release_slot()
+            # The stream has no length, so it ends by closing the connection
+            self.close_connection = True
+            seen = live_reload.version
+            try:
+                self.wfile.write(b"retry: 1000\n\n")
+                while not live_reload.closed:
+                    event = live_reload.wait(seen, timeout=keep_alive_timeout)
+                    if live_reload.closed:
+                        break
+                    if event is None:
+                        # A comment line keeps proxies from dropping the idle stream and detects closed pages
+                        self.wfile.write(b": ping\n\n")
+                        continue
+                    seen, data = event
+                    self.wfile.write(f"event: rebuilt\ndata: {data}\n\n".encode('utf-8'))
+            except (OSError, ValueError):
+                # The page went away; a write to its closed connection ends the stream
+                pass
+
+        def send_head(self):
+            """Serve a file with validators, answering 304 when the client's copy is current.
+
+            Sends a precompressed sibling or an on-the-fly compressed copy when the client accepts one,
+            and only the requested byte ranges of it for Range requests.
+            """
+            self.body_parts = None
+            path = self.translate_path(self.path)
+            if os.path.isdir(path) and self.path.split('?', 1)[0].split('#', 1)[0].endswith('/'):
+                path = next((os.path.join(path, index) for index in ('index.html', 'index.htm')
+                             if os.path.isfile(os.path.join(path, index))), path)
+            if not os.path.isfile(path):
+                return super().send_head()
+            content_type = self.guess_type(path)
+            stat = os.stat(path)
+            # Precompressed siblings older than their source are stale
+            siblings = {}
+            for encoding, suffix in COMPRESSION_SUFFIXES.items():
+                try:
+                    sibling_stat = os.stat(path + suffix)
                 except OSError:
-                    logger.info(f"Port {port} is in use, trying next port...")
-            raise OSError(f"Could not find an available port after {max_attempts} attempts")
+                    continue
+                if sibling_stat.st_mtime_ns >= stat.st_mtime_ns:
+                    siblings[encoding] = sibling_stat
+            compressible = is_compressible(path, content_type) and stat.st_size <= COMPRESSED_RESPONSE_MAX_FILE_BYTES
+            available = [encoding for encoding in COMPRESSION_SUFFIXES
+                         if encoding in siblings or (compressible and encoding in get_compression_encodings())]
+            encoding = negotiate_encoding(self.headers.get('Accept-Encoding', ''), available) if available else None
+            etag = make_etag(stat, encoding)
 
-        port = find_available_port()
-        handler = CustomHTTPRequestHandler
-        
-        with socketserver.TCPServer(("", port), handler) as httpd:
-            logger.info(f"Serving at http://localhost:{port}")
+            if is_not_modified(self.headers, etag, stat.st_mtime):
+                self.send_response(304)
+                self.send_validators(content_type, etag, stat, bool(available))
+                self.end_headers()
+                return None
+
+            if encoding in siblings:
+                body = open(path + COMPRESSION_SUFFIXES[encoding], 'rb')
+                length = siblings[encoding].st_size
+            elif encoding:
+                data = compressed_cache.get(path, stat, encoding)
+                body, length = io.BytesIO(data), len(data)
+            else:
+                body, length = open(path, 'rb'), stat.st_size
+
+            ranges = None
+            last_modified = self.date_time_string(int(stat.st_mtime))
+            if 'Range' in self.headers and if_range_matches(self.headers.get('If-Range', etag), etag, last_modified):
+                ranges = parse_byte_ranges(self.headers['Range'], length)
+                if ranges == []:
+                    body.close()
+                    self.send_response(416)
+                    self.send_header('Content-Range', f"bytes */{length}")
+                    self.send_header('Content-Length', '0')
+                    self.send_validators(content_type, etag, stat, bool(available))
+                    self.end_headers()
+                    return None
+
+            if not ranges:
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.body_parts = ([(b'', 0, length)], b'')
+            elif len(ranges) == 1:
+                start, end = ranges[0]
+                self.send_response(206)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Range', f"bytes {start}-{end}/{length}")
+                self.body_parts = ([(b'', start, end - start + 1)], b'')
+            else:
+                boundary = os.urandom(12).hex()
+                self.send_response(206)
+                self.send_header('Content-Type', f"multipart/byteranges; boundary={boundary}")
+                parts = [((f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+                           f"Content-Range: bytes {start}-{end}/{length}\r\n\r\n").encode('ascii'),
+                         start, end - start + 1)
+                         for start, end in ranges]
+                self.body_parts = (parts, f"\r\n--{boundary}--\r\n".encode('ascii'))
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            parts, trailer = self.body_parts
+            self.send_header('Content-Length', str(sum(len(header) + count for header, _, count in parts) + len(trailer)))
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_validators(content_type, etag, stat, bool(available))
+            self.end_headers()
+            return body
+
+        def copyfile(self, source, outputfile):
+            """Send the body, or its requested ranges, with zero-copy sendfile where the OS supports it."""
+            if self.body_parts is None:
+                return super().copyfile(source, outputfile)
+            parts, trailer = self.body_parts
+            for header, offset, count in parts:
+                if header:
+                    outputfile.write(header)
+                if count:
+                    # socket.sendfile uses os.sendfile for real files and falls back to send() otherwise
+                    self.connection.sendfile(source, offset, count)
+            if trailer:
+                outputfile.write(trailer)
+
+        def send_validators(self, content_type: str, etag: str, stat: os.stat_result, varies: bool):
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', self.date_time_string(int(stat.st_mtime)))
+            self.send_header('Cache-Control', get_cache_control(content_type, self.path.partition('?')[2]))
+            if varies:
+                # The body depends on Accept-Encoding, so caches must key on it
+                self.send_header('Vary', 'Accept-Encoding')
+
+        def end_headers(self):
+            # Add CSP header
+            self.send_header('Content-Security-Policy', "default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval'; style-src 'self' 'unsafe-inline';")
+            super().end_headers()
+
+    class BoundedHTTPServer(http.server.ThreadingHTTPServer):
+        """Threading HTTP server whose connection threads are daemons, so exiting never waits on open pages."""
+        allow_reuse_address = True
+        daemon_threads = True
+        request_queue_size = backlog
+
+    def find_available_port(start_port=8000, max_attempts=10):
+        for port in range(start_port, start_port + max_attempts):
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    s.bind((bind, port))
+                    return port
+            except OSError:
+                logger.info(f"Port {port} is in use, trying next port...")
+        raise OSError(f"Could not find an available port after {max_attempts} attempts")
+
+    port = find_available_port(port)
+    handler = CustomHTTPRequestHandler
+
+    with BoundedHTTPServer((bind, port), handler) as httpd:
+        logger.info(f"Serving at http://{bind or 'localhost'}:{port}, processing up to {workers} requests at once")
+        try:
             httpd.serve_forever()
-            
+        finally:
+            if live_reload is not None:
+                live_reload.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> 'argparse.Namespace':
+    """Parse the command line options."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the site and serve it locally.")
+    parser.add_argument('--force', action='store_true',
+                        help="regenerate every page even if its inputs are unchanged")
+    parser.add_argument('--pdf-dpi', type=int, default=PDF_PREVIEW_DPI,
+                        help=f"resolution for rasterizing presentation PDFs (default: {PDF_PREVIEW_DPI})")
+    parser.add_argument('--image-quality', action='append', default=[], metavar='FORMAT=QUALITY',
+                        help="encoder quality for an image format (avif, webp or jpeg), e.g. webp=70; "
+                             "changing it re-encodes the images on the next build")
+    parser.add_argument('--no-serve', action='store_true',
+                        help="build the site and exit without starting the local server")
+    parser.add_argument('--watch', action='store_true',
+                        help="rebuild the pages whose inputs change while the server keeps running")
+    parser.add_argument('--fast-compression', action='store_true',
+                        help="precompress with quick Brotli/gzip levels; watch-mode rebuilds always do")
+    parser.add_argument('--ghx-preview', choices=GHX_PREVIEW_MODES, default=GHX_PREVIEW_MODE,
+                        help="how the GHX code viewer shows definitions; 'canonical' re-indents them without "
+                             "redundant markup and 'minified' also drops indentation (default: original). "
+                             "Downloads are always the original file")
+    parser.add_argument('--live-reload', action='store_true',
+                        help="include the live reload client in the pages (implied by --watch while serving)")
+    parser.add_argument('--watch-interval', type=float, default=WATCH_INTERVAL,
+                        help=f"seconds between polls of the build inputs in watch mode (default: {WATCH_INTERVAL})")
+    parser.add_argument('--port', type=int, default=8000,
+                        help="first port to try for the local server (default: 8000)")
+    parser.add_argument('--bind', default='',
+                        help="address for the local server to listen on (default: all interfaces)")
+    parser.add_argument('--workers', type=int, default=16,
+                        help="requests the local server processes at once; idle connections don't count (default: 16)")
+    parser.add_argument('--backlog', type=int, default=128,
+                        help="connections the OS queues before the server accepts them (default: 128)")
+    parser.add_argument('--keep-alive-timeout', type=float, default=5.0,
+                        help="seconds an idle keep-alive connection is held open (default: 5)")
+    args = parser.parse_args(argv)
+    for setting in args.image_quality:
+        image_format, _, quality = setting.partition('=')
+        if image_format not in IMAGE_QUALITY or not quality.isdigit() or not 1 <= int(quality) <= 100:
+            parser.error(f"invalid --image-quality {setting!r}")
+        IMAGE_QUALITY[image_format] = int(quality)
+    return args
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to generate the site."""
+    import threading
+
+    global PDF_PREVIEW_DPI, LIVE_RELOAD, GHX_PREVIEW_MODE
+    args = parse_args(argv)
+    PDF_PREVIEW_DPI = args.pdf_dpi
+    GHX_PREVIEW_MODE = args.ghx_preview
+    # Pages only get the live reload client when a watching server is there to drive it
+    LIVE_RELOAD = args.live_reload or (args.watch and not args.no_serve)
+    live_reload = LiveReloadChannel() if args.watch and not args.no_serve else None
+    try:
+        # Generate all pages
+        build_site(force=args.force, fast_compression=args.fast_compression)
+        if args.watch:
+            # Rebuilds get the same build options, but never --force, and compress quickly
+            build_argv = [f"--pdf-dpi={args.pdf_dpi}", f"--ghx-preview={args.ghx_preview}", '--fast-compression']
+            build_argv += [f"--image-quality={setting}" for setting in args.image_quality]
+            if LIVE_RELOAD:
+                build_argv.append('--live-reload')
+            logger.info("Watching archive/, toolbox/ and generate_site.py for changes")
+            if args.no_serve:
+                watch_and_rebuild(build_argv, args.watch_interval)
+                return
+            threading.Thread(target=watch_and_rebuild, name='watch', daemon=True,
+                             args=(build_argv, args.watch_interval, WATCH_DEBOUNCE,
+                                   lambda pages, changed: live_reload.publish(get_live_reload_event(pages, changed)))
+                             ).start()
+        if args.no_serve:
+            return
+
+        serve_site(port=args.port, bind=args.bind, workers=args.workers, backlog=args.backlog,
+                   keep_alive_timeout=args.keep_alive_timeout, live_reload=live_reload)
+
     except Exception as e:
         logger.error(f"Error generating site: {e}")
         raise